@@ -0,0 +1,73 @@
+"""Add system_settings table for persistent configuration
+
+Revision ID: 004_add_system_settings
+Revises: 003_complete_schema
+Create Date: 2025-11-06 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '004_add_system_settings'
+down_revision = '003_complete_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create system_settings table for database-backed configuration."""
+    op.create_table(
+        'system_settings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('claim_timeout_hours', sa.Integer(), nullable=False, server_default='24'),
+        sa.Column('max_claims_per_user', sa.Integer(), nullable=False, server_default='3'),
+        sa.Column('auto_release_enabled', sa.Boolean(), nullable=False, server_default='true'),
+        sa.Column('webhook_secret', sa.String(length=255), nullable=True),
+        sa.Column('notification_settings', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('rate_limiting', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('github_integration', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_system_settings_id'), 'system_settings', ['id'], unique=False)
+    
+    # Insert default settings row (parameter-bound via executemany)
+    system_settings = sa.table(
+        'system_settings',
+        sa.column('id', sa.Integer),
+        sa.column('claim_timeout_hours', sa.Integer),
+        sa.column('max_claims_per_user', sa.Integer),
+        sa.column('auto_release_enabled', sa.Boolean),
+        sa.column('notification_settings', postgresql.JSON),
+        sa.column('rate_limiting', postgresql.JSON),
+        sa.column('github_integration', postgresql.JSON),
+    )
+    op.bulk_insert(system_settings, [
+        {
+            'id': 1,
+            'claim_timeout_hours': 24,
+            'max_claims_per_user': 3,
+            'auto_release_enabled': True,
+            'notification_settings': {
+                'email_enabled': False,
+                'slack_enabled': False,
+                'discord_enabled': False
+            },
+            'rate_limiting': {
+                'enabled': True,
+                'requests_per_minute': 60
+            },
+            'github_integration': {
+                'app_id': None,
+                'installation_id': None,
+                'webhook_url': None
+            },
+        }
+    ])
+
+
+def downgrade() -> None:
+    """Drop system_settings table."""
+    op.drop_index(op.f('ix_system_settings_id'), table_name='system_settings')
+    op.drop_table('system_settings')
@@ -0,0 +1,44 @@
+"""Store system_settings JSON columns as jsonb
+
+Revision ID: 005_system_settings_jsonb
+Revises: 004_add_system_settings
+Create Date: 2024-11-07 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005_system_settings_jsonb'
+down_revision = '004_add_system_settings'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = ('notification_settings', 'rate_limiting', 'github_integration')
+
+
+def upgrade() -> None:
+    """Convert system_settings JSON columns to binary jsonb."""
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'system_settings',
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=postgresql.JSON(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb'
+        )
+
+
+def downgrade() -> None:
+    """Convert system_settings jsonb columns back to json."""
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'system_settings',
+            column,
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json'
+        )
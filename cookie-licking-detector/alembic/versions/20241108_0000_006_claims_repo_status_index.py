@@ -0,0 +1,38 @@
+"""Add covering index on claims (repository_id, status)
+
+Revision ID: 006_claims_repo_status_index
+Revises: 005_system_settings_jsonb
+Create Date: 2024-11-08 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_claims_repo_status_index'
+down_revision = '005_system_settings_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Let per-repository active claim counts use an index-only scan."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_claims_repo_status',
+            'claims',
+            ['repository_id', 'status'],
+            unique=False,
+            postgresql_include=['id'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the claims (repository_id, status) index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_claims_repo_status',
+            table_name='claims',
+            postgresql_concurrently=True
+        )
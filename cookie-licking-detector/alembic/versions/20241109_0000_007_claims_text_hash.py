@@ -0,0 +1,76 @@
+"""Add normalized claim_text_hash to claims
+
+Revision ID: 007_claims_text_hash
+Revises: 006_claims_repo_status_index
+Create Date: 2024-11-09 00:00:00.000000
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_claims_text_hash'
+down_revision = '006_claims_repo_status_index'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _hash_claim_text(text):
+    """
+    SHA-1 of the trimmed, lowercased message. A frozen copy of
+    app.db.models.claims.hash_claim_text as of this revision, so later model
+    changes cannot alter what this backfill computes
+    """
+    return hashlib.sha1(text.lower().strip().encode("utf-8")).digest()
+
+
+def upgrade() -> None:
+    """Add claim_text_hash (SHA-1 of the normalized message), indexed per user."""
+    op.add_column(
+        'claims',
+        sa.Column('claim_text_hash', sa.LargeBinary(length=20), nullable=True)
+    )
+    
+    # Backfill existing rows in id order with the same normalization the
+    # Claim model applies to new rows (Python's str.lower()/strip() rules),
+    # so the digests match
+    bind = op.get_bind()
+    select_batch = sa.text("""
+        SELECT id, claim_text FROM claims
+        WHERE id > :last_id AND claim_text IS NOT NULL AND claim_text <> ''
+        ORDER BY id
+        LIMIT :batch_size
+    """)
+    update_hash = sa.text(
+        "UPDATE claims SET claim_text_hash = :claim_text_hash WHERE id = :id"
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            select_batch,
+            {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE}
+        ).all()
+        if not rows:
+            break
+        bind.execute(update_hash, [
+            {"id": row.id, "claim_text_hash": _hash_claim_text(row.claim_text)}
+            for row in rows
+        ])
+        last_id = rows[-1].id
+    
+    op.create_index(
+        'ix_claims_user_text_hash',
+        'claims',
+        ['github_user_id', 'claim_text_hash'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop claim_text_hash and its index."""
+    op.drop_index('ix_claims_user_text_hash', table_name='claims')
+    op.drop_column('claims', 'claim_text_hash')
@@ -0,0 +1,44 @@
+"""Add covering indexes on claims (github_user_id, created_at) and (github_user_id, status)
+
+Revision ID: 008_claims_user_indexes
+Revises: 007_claims_text_hash
+Create Date: 2024-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_claims_user_indexes'
+down_revision = '007_claims_text_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Let per-user rapid-claim and active-claim counts use index-only scans."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_claims_user_created',
+            'claims',
+            ['github_user_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_include=['id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_claims_user_status',
+            'claims',
+            ['github_user_id', 'status'],
+            unique=False,
+            postgresql_include=['id'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the per-user claims indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_claims_user_status', table_name='claims', postgresql_concurrently=True)
+        op.drop_index('ix_claims_user_created', table_name='claims', postgresql_concurrently=True)
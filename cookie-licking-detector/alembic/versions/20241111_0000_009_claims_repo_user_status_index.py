@@ -0,0 +1,35 @@
+"""Add index on claims (repository_id, github_username, status)
+
+Revision ID: 009_claims_repo_user_status
+Revises: 008_claims_user_indexes
+Create Date: 2024-11-11 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_claims_repo_user_status'
+down_revision = '008_claims_user_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Let per-repository contribution counts use an index-only scan."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_claims_repo_user_status',
+            'claims',
+            ['repository_id', 'github_username', 'status'],
+            unique=False,
+            postgresql_include=['id'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the claims (repository_id, github_username, status) index."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_claims_repo_user_status', table_name='claims', postgresql_concurrently=True)
@@ -16,6 +16,7 @@ from datetime import datetime
 from app.db.database import get_async_session
 from app.db.models import Claim, ActivityLog, Issue, Repository, ClaimStatus
 from app.tasks.nudge_check import check_stale_claims_task
+from app.intelligence.behavioral_analyzer import invalidate_behavior_cache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -98,42 +99,45 @@ async def list_claims(
     if user:
         filters.append(Claim.github_username.ilike(f"%{user}%"))
     
-    # Build single base query for counting
-    base_query = select(Claim.id).join(
-        Issue, Claim.issue_id == Issue.id
+    # Page and total in one statement: COUNT(*) OVER () carries the total
+    # number of matching rows on every row of the page
+    stmt = select(
+        Claim, Issue, Repository, func.count().over().label("total_count")
     ).join(
-        Repository, Issue.repository_id == Repository.id
-    )
-    
-    # Apply all filters to base query
-    if filters:
-        base_query = base_query.where(*filters)
-    
-    # Get total count using the base query
-    count_stmt = select(func.count()).select_from(base_query.subquery())
-    count_result = await db.execute(count_stmt)
-    total_count = count_result.scalar()
-    
-    # Build data query with same filters
-    stmt = select(Claim, Issue, Repository).join(
         Issue, Claim.issue_id == Issue.id
     ).join(
         Repository, Issue.repository_id == Repository.id
     )
     
-    # Apply same filters to data query
+    # Apply all filters
     if filters:
         stmt = stmt.where(*filters)
     
     # Apply pagination
     offset = (page - 1) * per_page
-    stmt = stmt.offset(offset).limit(per_page)
+    stmt = stmt.order_by(Claim.id).offset(offset).limit(per_page)
     result = await db.execute(stmt)
     claims_data = result.all()
     
+    if claims_data:
+        total_count = claims_data[0].total_count
+    elif offset == 0:
+        total_count = 0
+    else:
+        # Page past the end carries no rows to read the total from
+        count_stmt = select(func.count(Claim.id)).join(
+            Issue, Claim.issue_id == Issue.id
+        ).join(
+            Repository, Issue.repository_id == Repository.id
+        )
+        if filters:
+            count_stmt = count_stmt.where(*filters)
+        count_result = await db.execute(count_stmt)
+        total_count = count_result.scalar()
+    
     # Format response
     claim_responses = []
-    for claim, issue, repository in claims_data:
+    for claim, issue, repository, _ in claims_data:
         claim_data = ClaimResponse(
             id=claim.id,
             issue_id=claim.issue_id,
@@ -338,6 +342,7 @@ async def manually_release_claim(
         
         db.add(release_log)
         await db.commit()
+        invalidate_behavior_cache(claim.github_user_id)
         
         # Remove GitHub assignment if exists
         try:
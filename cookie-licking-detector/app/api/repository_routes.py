@@ -6,18 +6,63 @@ As specified in MD file API Design section:
 - PUT /api/repositories/{id}
 - DELETE /api/repositories/{id}
 """
+import base64
+import binascii
+import json
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, lambda_stmt
+from sqlalchemy.orm import with_expression
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from datetime import datetime
 
-from app.db.database import get_async_session
-from app.db.models import Repository, User
+from app.db.database import get_async_session, transaction
+from app.db.models import Repository, User, Issue, Claim, ClaimStatus
 from app.core.security import get_current_user
+from app.core.logging import get_logger
 
 router = APIRouter()
+logger = get_logger(__name__)
+
+# Rows fetched per round trip while streaming repository listings
+STREAM_BATCH_SIZE = 100
+
+# Appended in place of the closing bracket when a listing fails mid-stream,
+# so the body is no longer valid JSON
+STREAM_ERROR_MARKER = b'\n{"error": "repository stream aborted"}\n'
+
+# Correlated count subqueries loaded onto Repository.total_issues and
+# Repository.active_claims_count in the same SELECT as the repositories
+REPOSITORY_TOTAL_ISSUES = (
+    select(func.count(Issue.id))
+    .where(Issue.repository_id == Repository.id)
+    .scalar_subquery()
+)
+REPOSITORY_ACTIVE_CLAIMS = (
+    select(func.count(Claim.id))
+    .where(Claim.repository_id == Repository.id, Claim.status == ClaimStatus.ACTIVE)
+    .scalar_subquery()
+)
+
+
+def _encode_cursor(last_id: int) -> str:
+    """Encode the last seen repository id as an opaque pagination cursor"""
+    return base64.urlsafe_b64encode(json.dumps([last_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> int:
+    """Decode a pagination cursor produced by _encode_cursor"""
+    try:
+        (last_id,) = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(last_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
 
 # Pydantic models for API
 class RepositoryCreate(BaseModel):
@@ -52,6 +97,13 @@ class RepositoryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
+    @field_validator("total_issues", "active_claims_count", mode="before")
+    @classmethod
+    def default_unloaded_count(cls, v):
+        # Counts are only loaded by queries using with_expression(); rows
+        # obtained any other way may leave them unset
+        return 0 if v is None else v
+    
     class Config:
         from_attributes = True
 
@@ -108,86 +160,130 @@ async def register_repository(
             is_monitored=True
         )
         
-        db.add(new_repo)
-        await db.commit()
-        await db.refresh(new_repo)
+        async with transaction(db):
+            db.add(new_repo)
+        
+        # A new repository has no issues or claims yet; query_expression
+        # attributes are only populated on rows loaded by a query
+        new_repo.total_issues = 0
+        new_repo.active_claims_count = 0
         
         return new_repo
         
     except HTTPException:
         raise
     except Exception as e:
-        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error registering repository: {str(e)}"
         )
 
-@router.get("/repositories", response_model=List[RepositoryResponse])
+# The body is streamed, so there is no response_model to validate against;
+# the schema is still documented for the OpenAPI spec
+@router.get(
+    "/repositories",
+    responses={
+        200: {
+            "model": List[RepositoryResponse],
+            "description": (
+                "Repositories, streamed as a JSON array; a failure mid-stream "
+                "ends the body with an error object instead of the closing bracket"
+            ),
+            "headers": {
+                "X-Next-Cursor": {
+                    "description": "Cursor for the next page, when more rows are available",
+                    "schema": {"type": "string"}
+                }
+            }
+        }
+    }
+)
 async def list_repositories(
     status_filter: Optional[str] = Query(None, description="Filter by monitoring status"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    skip: Optional[int] = Query(None, ge=0, deprecated=True, description="Deprecated: number of records to skip; use cursor instead"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     db: AsyncSession = Depends(get_async_session)
 ):
     """
     List monitored repositories
     As specified in MD file: GET /api/repositories
+    
+    Uses keyset pagination on repository id; when more rows are available
+    the cursor for the next page is returned in the X-Next-Cursor header.
+    The JSON array is streamed in batches rather than built in memory.
+    
+    The offset-based skip parameter is still accepted during its deprecation
+    period, but cannot be combined with cursor.
     """
-    from sqlalchemy import func
-    from app.db.models.issues import Issue
-    from app.db.models.claims import Claim, ClaimStatus
+    if skip is not None and cursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="skip and cursor cannot be used together"
+        )
+    last_id = _decode_cursor(cursor) if cursor else None
+    offset = skip or 0
     
-    stmt = select(Repository)
+    def apply_filters(stmt):
+        # Status filter and keyset position, shared by both queries below
+        if status_filter == "active":
+            stmt += lambda s: s.where(Repository.is_monitored == True)
+        elif status_filter == "inactive":
+            stmt += lambda s: s.where(Repository.is_monitored == False)
+        if last_id is not None:
+            stmt += lambda s: s.where(Repository.id > last_id)
+        return stmt
     
-    # Apply status filter
-    if status_filter == "active":
-        stmt = stmt.where(Repository.is_monitored == True)
-    elif status_filter == "inactive":
-        stmt = stmt.where(Repository.is_monitored == False)
+    # Statements are built as lambda statements so SQLAlchemy caches the
+    # compiled SQL per shape; cursor and page size are bound as parameters.
+    # Peek at the primary key index for the last row of this page and the
+    # row after it; the headers must be known before streaming starts
+    boundary_offset = offset + limit - 1
+    boundary_stmt = apply_filters(lambda_stmt(lambda: select(Repository.id)))
+    boundary_stmt += lambda s: s.order_by(Repository.id).offset(boundary_offset).limit(2)
+    boundary_ids = (await db.execute(boundary_stmt)).scalars().all()
     
-    # Apply pagination
-    stmt = stmt.offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    repositories = result.scalars().all()
+    headers = {}
+    if len(boundary_ids) == 2:
+        headers["X-Next-Cursor"] = _encode_cursor(boundary_ids[0])
     
-    # Enrich with counts
-    enriched_repos = []
-    for repo in repositories:
-        # Count total issues
-        issues_stmt = select(func.count(Issue.id)).where(Issue.repository_id == repo.id)
-        issues_result = await db.execute(issues_stmt)
-        total_issues = issues_result.scalar() or 0
-        
-        # Count active claims
-        claims_stmt = select(func.count(Claim.id)).where(
-            Claim.repository_id == repo.id,
-            Claim.status == ClaimStatus.ACTIVE
+    stmt = apply_filters(lambda_stmt(lambda: select(Repository).options(
+        with_expression(Repository.total_issues, REPOSITORY_TOTAL_ISSUES),
+        with_expression(Repository.active_claims_count, REPOSITORY_ACTIVE_CLAIMS)
+    )))
+    stmt += lambda s: s.order_by(Repository.id).offset(offset).limit(limit)
+    result = await db.stream(stmt, execution_options={"yield_per": STREAM_BATCH_SIZE})
+    batches = result.scalars().partitions()
+    
+    def encode(batch):
+        # Counts are loaded onto the ORM rows, so validate them directly
+        return b",".join(
+            RepositoryResponse.model_validate(repo).model_dump_json().encode()
+            for repo in batch
         )
-        claims_result = await db.execute(claims_stmt)
-        active_claims = claims_result.scalar() or 0
-        
-        # Create response dict
-        repo_dict = {
-            "id": repo.id,
-            "github_repo_id": repo.github_repo_id,
-            "owner_name": repo.owner_name,
-            "name": repo.name,
-            "full_name": repo.full_name,
-            "url": repo.url,
-            "is_monitored": repo.is_monitored,
-            "grace_period_days": repo.grace_period_days,
-            "nudge_count": repo.nudge_count,
-            "claim_detection_threshold": repo.claim_detection_threshold,
-            "notification_settings": repo.notification_settings or {},
-            "total_issues": total_issues,
-            "active_claims_count": active_claims,
-            "created_at": repo.created_at,
-            "updated_at": repo.updated_at
-        }
-        enriched_repos.append(repo_dict)
     
-    return enriched_repos
+    # Fetch and encode the first batch before the response starts, so query
+    # and validation errors still surface as a regular error response
+    first_batch = await anext(batches, None)
+    if first_batch is None:
+        return Response(content=b"[]", media_type="application/json", headers=headers)
+    first_chunk = encode(first_batch)
+    
+    async def generate():
+        yield b"[" + first_chunk
+        try:
+            async for batch in batches:
+                yield b"," + encode(batch)
+        except Exception as e:
+            # The 200 status is already sent; end the body with an error
+            # marker and leave the array unclosed so clients cannot mistake
+            # the truncated listing for a complete one
+            logger.error(f"Error streaming repositories: {e}")
+            yield STREAM_ERROR_MARKER
+            return
+        yield b"]"
+    
+    return StreamingResponse(generate(), media_type="application/json", headers=headers)
 
 @router.put("/repositories/{repo_id}", response_model=RepositoryResponse)
 async def update_repository(
@@ -200,10 +296,8 @@ async def update_repository(
     As specified in MD file: PUT /api/repositories/{id}
     """
     
-    # Get repository
-    stmt = select(Repository).where(Repository.id == repo_id)
-    result = await db.execute(stmt)
-    repository = result.scalar_one_or_none()
+    # Get repository (identity-map aware primary key lookup)
+    repository = await db.get(Repository, repo_id)
     if not repository:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -212,17 +306,14 @@ async def update_repository(
     
     try:
         # Update fields
-        update_data = repo_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(repository, field, value)
-        
-        await db.commit()
-        await db.refresh(repository)
+        async with transaction(db):
+            update_data = repo_update.model_dump(exclude_unset=True)
+            for field, value in update_data.items():
+                setattr(repository, field, value)
         
         return repository
         
     except Exception as e:
-        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error updating repository: {str(e)}"
@@ -238,10 +329,8 @@ async def stop_monitoring_repository(
     As specified in MD file: DELETE /api/repositories/{id}
     """
     
-    # Get repository
-    stmt = select(Repository).where(Repository.id == repo_id)
-    result = await db.execute(stmt)
-    repository = result.scalar_one_or_none()
+    # Get repository (identity-map aware primary key lookup)
+    repository = await db.get(Repository, repo_id)
     if not repository:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -250,8 +339,8 @@ async def stop_monitoring_repository(
     
     try:
         # Instead of deleting, mark as not monitored
-        repository.is_monitored = False
-        await db.commit()
+        async with transaction(db):
+            repository.is_monitored = False
         
         return {
             "message": f"Stopped monitoring repository {repository.owner_name}/{repository.name}",
@@ -259,7 +348,6 @@ async def stop_monitoring_repository(
         }
         
     except Exception as e:
-        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error stopping monitoring: {str(e)}"
@@ -2,19 +2,73 @@
 Settings API Routes
 Provides system configuration and monitoring endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+import asyncio
+import time
+from dataclasses import dataclass
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection, AsyncSession
+from sqlalchemy import select, func, text
+from sqlalchemy.exc import IntegrityError
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
 
-from app.db.database import get_async_session
+from app.db.database import get_async_session, is_db_healthy, transaction
 from app.db.models import Repository, User, SystemSettings
+from app.core.config import get_settings as get_app_settings
+from app.core.logging import get_logger
 from app.core.security import get_current_user, require_admin
 
+logger = get_logger(__name__)
+
 router = APIRouter()
 
+# Postgres channel used to tell every worker that the settings row changed
+SETTINGS_CHANNEL = "system_settings_changed"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedSettings:
+    """Detached snapshot of the settings row's column values"""
+    claim_timeout_hours: int
+    max_claims_per_user: int
+    auto_release_enabled: bool
+    webhook_secret: Optional[str]
+    notification_settings: Optional[dict]
+    rate_limiting: Optional[dict]
+    github_integration: Optional[dict]
+
+
+def _snapshot_settings(settings: SystemSettings) -> CachedSettings:
+    """Copy column values out of a loaded row so the cache never holds ORM state"""
+    return CachedSettings(
+        claim_timeout_hours=settings.claim_timeout_hours,
+        max_claims_per_user=settings.max_claims_per_user,
+        auto_release_enabled=settings.auto_release_enabled,
+        webhook_secret=settings.webhook_secret,
+        notification_settings=dict(settings.notification_settings) if settings.notification_settings else None,
+        rate_limiting=dict(settings.rate_limiting) if settings.rate_limiting else None,
+        github_integration=dict(settings.github_integration) if settings.github_integration else None
+    )
+
+
+# In-process cache of the settings row: (monotonic load time, snapshot)
+_SETTINGS_CACHE_TTL = 30.0
+_settings_cache: Optional[Tuple[float, CachedSettings]] = None
+_settings_listener: Optional[AsyncConnection] = None
+
+# Delay between attempts to re-subscribe after the listener connection drops
+_LISTENER_RETRY_DELAY = 5.0
+_listener_engine: Optional[AsyncEngine] = None
+_listener_reconnect_task: Optional[asyncio.Task] = None
+
+# Repository count shown on the stats page: (monotonic load time, count)
+_REPO_COUNT_CACHE_TTL = 60.0
+_repo_count_cache: Optional[Tuple[float, int]] = None
+
+# Fallback start time when the app lifespan has not recorded one
+_MODULE_LOADED_AT = datetime.now(timezone.utc)
+
 class NotificationSettings(BaseModel):
     email_enabled: bool = False
     slack_enabled: bool = False
@@ -47,45 +101,166 @@ class SystemStats(BaseModel):
     cache_hit_rate: float
 
 
+def _default_settings_values() -> Dict[str, Any]:
+    """Column values of the default settings row (as seeded by migration 004)"""
+    return {
+        "claim_timeout_hours": 24,
+        "max_claims_per_user": 3,
+        "auto_release_enabled": True,
+        "webhook_secret": None,
+        "notification_settings": {
+            "email_enabled": False,
+            "slack_enabled": False,
+            "discord_enabled": False
+        },
+        "rate_limiting": {
+            "enabled": True,
+            "requests_per_minute": 60
+        },
+        "github_integration": {
+            "app_id": None,
+            "installation_id": None,
+            "webhook_url": None
+        }
+    }
+
+
 async def get_or_create_settings(db: AsyncSession) -> SystemSettings:
     """
-    Get settings from database or create default settings if none exist.
-    Ensures single row table for application configuration.
+    Get the settings row for modification, creating it with the defaults if
+    it is missing. Ensures single row table for application configuration.
+    Write path only (call inside a transaction); reads use get_cached_settings.
     """
-    stmt = select(SystemSettings).limit(1)
-    result = await db.execute(stmt)
-    settings = result.scalar_one_or_none()
+    settings = await db.get(SystemSettings, 1)
     
-    if not settings:
-        # Create default settings on first access
-        settings = SystemSettings(
-            id=1,
-            claim_timeout_hours=24,
-            max_claims_per_user=3,
-            auto_release_enabled=True,
-            webhook_secret=None,
-            notification_settings={
-                "email_enabled": False,
-                "slack_enabled": False,
-                "discord_enabled": False
-            },
-            rate_limiting={
-                "enabled": True,
-                "requests_per_minute": 60
-            },
-            github_integration={
-                "app_id": None,
-                "installation_id": None,
-                "webhook_url": None
-            }
-        )
-        db.add(settings)
-        await db.commit()
-        await db.refresh(settings)
+    if settings is None:
+        # Migration 004 seeds the row, so this only runs on a database where
+        # it was deleted. The savepoint keeps the outer transaction usable if
+        # a concurrent worker creates the row first
+        try:
+            async with db.begin_nested():
+                settings = SystemSettings(id=1, **_default_settings_values())
+                db.add(settings)
+        except IntegrityError:
+            settings = await db.get(SystemSettings, 1)
     
     return settings
 
 
+def invalidate_settings_cache(*_args) -> None:
+    """Drop the cached settings row (also used as the NOTIFY callback)"""
+    global _settings_cache
+    _settings_cache = None
+
+
+async def get_cached_settings(db: AsyncSession) -> CachedSettings:
+    """
+    Get a snapshot of the settings from the in-process cache, reloading from
+    the database once the TTL has expired or another worker announced a
+    change. Never writes; a missing row reads as the defaults. Use
+    get_or_create_settings to modify the row.
+    """
+    global _settings_cache
+    if _settings_cache is not None and time.monotonic() - _settings_cache[0] < _SETTINGS_CACHE_TTL:
+        return _settings_cache[1]
+    
+    settings = await db.get(SystemSettings, 1)
+    if settings is not None:
+        snapshot = _snapshot_settings(settings)
+    else:
+        snapshot = CachedSettings(**_default_settings_values())
+    _settings_cache = (time.monotonic(), snapshot)
+    return snapshot
+
+
+async def get_webhook_secret(db: AsyncSession) -> Optional[bytes]:
+    """
+    Webhook secret from the cached system settings, falling back to the
+    GITHUB_WEBHOOK_SECRET environment setting. Returns None if neither is set.
+    """
+    settings = await get_cached_settings(db)
+    secret = settings.webhook_secret or get_app_settings().GITHUB_WEBHOOK_SECRET
+    return secret.encode("utf-8") if secret else None
+
+
+async def _subscribe_settings_listener(engine: AsyncEngine) -> None:
+    """Open the listener connection and LISTEN on the settings channel"""
+    global _settings_listener
+    conn = await engine.connect()
+    try:
+        raw_conn = await conn.get_raw_connection()
+        driver_conn = raw_conn.driver_connection
+        await driver_conn.add_listener(SETTINGS_CHANNEL, invalidate_settings_cache)
+        driver_conn.add_termination_listener(_on_settings_listener_terminated)
+    except Exception:
+        await conn.close()
+        raise
+    _settings_listener = conn
+
+
+def _on_settings_listener_terminated(*_args) -> None:
+    """
+    The listener connection dropped: notifications may have been missed, so
+    drop the cache and re-subscribe in the background
+    """
+    global _settings_listener, _listener_reconnect_task
+    invalidate_settings_cache()
+    dead_conn, _settings_listener = _settings_listener, None
+    if _listener_engine is None:
+        return
+    if _listener_reconnect_task is None or _listener_reconnect_task.done():
+        logger.warning("Settings listener connection lost, reconnecting")
+        _listener_reconnect_task = asyncio.get_running_loop().create_task(
+            _resubscribe_settings_listener(_listener_engine, dead_conn)
+        )
+
+
+async def _resubscribe_settings_listener(
+    engine: AsyncEngine,
+    dead_conn: Optional[AsyncConnection] = None
+) -> None:
+    """Retry the subscription until it succeeds or the listener is stopped"""
+    if dead_conn is not None:
+        # Return the broken connection to the pool, which discards it
+        try:
+            await dead_conn.close()
+        except Exception:
+            pass
+    
+    while _listener_engine is engine and _settings_listener is None:
+        try:
+            await _subscribe_settings_listener(engine)
+        except Exception as e:
+            logger.warning(f"Settings listener reconnect failed: {e}")
+            await asyncio.sleep(_LISTENER_RETRY_DELAY)
+        else:
+            # Changes made while disconnected were not announced
+            invalidate_settings_cache()
+            logger.info("Settings listener reconnected")
+
+
+async def start_settings_listener(engine: AsyncEngine) -> None:
+    """Subscribe to settings change notifications from other workers"""
+    global _listener_engine
+    if engine.dialect.name != "postgresql" or _settings_listener is not None:
+        return
+    
+    _listener_engine = engine
+    await _subscribe_settings_listener(engine)
+
+
+async def stop_settings_listener() -> None:
+    """Release the connection held for settings change notifications"""
+    global _settings_listener, _listener_engine, _listener_reconnect_task
+    _listener_engine = None
+    if _listener_reconnect_task is not None:
+        _listener_reconnect_task.cancel()
+        _listener_reconnect_task = None
+    if _settings_listener is not None:
+        conn, _settings_listener = _settings_listener, None
+        await conn.close()
+
+
 @router.get("/settings", response_model=SystemSettingsModel)
 async def get_settings(
     current_user: User = Depends(require_admin),
@@ -94,7 +269,7 @@ async def get_settings(
     """
     Get current system settings from database (admin only)
     """
-    settings = await get_or_create_settings(db)
+    settings = await get_cached_settings(db)
     
     # Convert database model to response model
     return SystemSettingsModel(
@@ -117,59 +292,62 @@ async def update_settings(
     """
     Update system settings in database (admin only)
     """
-    # Basic validation
-    if settings_update.claim_timeout_hours < 1 or settings_update.claim_timeout_hours > 168:
-        raise HTTPException(
-            status_code=400,
-            detail="claim_timeout_hours must be between 1 and 168 hours"
-        )
-    
-    if settings_update.max_claims_per_user < 1 or settings_update.max_claims_per_user > 10:
-        raise HTTPException(
-            status_code=400,
-            detail="max_claims_per_user must be between 1 and 10"
-        )
-    
-    # Get existing settings or create new
-    settings = await get_or_create_settings(db)
+    # Range checks are enforced by the SystemSettingsModel Field constraints,
+    # which reject invalid input with a 422 before this handler runs
+    async with transaction(db):
+        # Get existing settings or create new
+        settings = await get_or_create_settings(db)
+        
+        # Update settings in database
+        settings.claim_timeout_hours = settings_update.claim_timeout_hours
+        settings.max_claims_per_user = settings_update.max_claims_per_user
+        settings.auto_release_enabled = settings_update.auto_release_enabled
+        settings.webhook_secret = settings_update.webhook_secret
+        settings.notification_settings = settings_update.notification_settings.model_dump(mode="json")
+        settings.rate_limiting = settings_update.rate_limiting.model_dump(mode="json")
+        settings.github_integration = settings_update.github_integration.model_dump(mode="json")
+        
+        # Tell the other workers to drop their cached copy once this commits
+        if db.bind.dialect.name == "postgresql":
+            await db.execute(text(f"NOTIFY {SETTINGS_CHANNEL}"))
+        
+        snapshot = _snapshot_settings(settings)
     
-    # Update settings in database
-    settings.claim_timeout_hours = settings_update.claim_timeout_hours
-    settings.max_claims_per_user = settings_update.max_claims_per_user
-    settings.auto_release_enabled = settings_update.auto_release_enabled
-    settings.webhook_secret = settings_update.webhook_secret
-    settings.notification_settings = settings_update.notification_settings.dict()
-    settings.rate_limiting = settings_update.rate_limiting.dict()
-    settings.github_integration = settings_update.github_integration.dict()
-    
-    await db.commit()
-    await db.refresh(settings)
+    global _settings_cache
+    _settings_cache = (time.monotonic(), snapshot)
     
     return settings_update
 
 @router.get("/system/stats", response_model=SystemStats)
 async def get_system_stats(
+    request: Request,
     db: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(require_admin)
 ):
     """
     Get system performance statistics (admin only)
     """
+    global _repo_count_cache
     
-    # Get database statistics
-    repo_count_stmt = select(func.count(Repository.id))
-    repo_count_result = await db.execute(repo_count_stmt)
-    repo_count = repo_count_result.scalar()
+    # Get database statistics (approximate; refreshed at most once per TTL)
+    if _repo_count_cache is not None and time.monotonic() - _repo_count_cache[0] < _REPO_COUNT_CACHE_TTL:
+        repo_count = _repo_count_cache[1]
+    else:
+        repo_count_stmt = select(func.count(Repository.id))
+        repo_count_result = await db.execute(repo_count_stmt)
+        repo_count = repo_count_result.scalar()
+        _repo_count_cache = (time.monotonic(), repo_count)
     
-    # Calculate uptime (mock for now)
-    uptime_hours = 168.5  # 1 week example
+    # Uptime from the start time recorded once during application startup
+    started_at = getattr(request.app.state, "started_at", None) or _MODULE_LOADED_AT
+    uptime_hours = (datetime.now(timezone.utc) - started_at).total_seconds() / 3600
     
     # Mock stats (in production, these would come from monitoring systems)
     stats = SystemStats(
         total_requests=15420 + repo_count * 100,  # Mock calculation
         average_response_time=45,  # milliseconds
         uptime_hours=uptime_hours,
-        last_restart=datetime.utcnow().isoformat(),
+        last_restart=started_at.isoformat(),
         database_size="12.4 MB",
         cache_hit_rate=89.2
     )
@@ -189,17 +367,13 @@ async def restart_system(current_user: User = Depends(require_admin)):
     }
 
 @router.get("/system/health")
-async def get_system_health(db: AsyncSession = Depends(get_async_session)):
+async def get_system_health():
     """
     Get system health status (public endpoint)
     """
-    try:
-        # Test database connection
-        test_stmt = select(1)
-        await db.execute(test_stmt)
-        db_healthy = True
-    except Exception:
-        db_healthy = False
+    # Database reachability comes from the background heartbeat, so load
+    # balancer probes never check out a pooled connection
+    db_healthy = is_db_healthy()
     
     health_status = {
         "status": "healthy" if db_healthy else "unhealthy",
@@ -15,6 +15,7 @@ from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.core.monitoring import track_api_call
 from app.db.database import get_async_session
+from app.api.settings_routes import get_webhook_secret
 from app.workers.comment_analysis import analyze_comment_for_claim
 from app.tasks.progress_check import check_progress_task, update_progress_task
 from app.db.models.repositories import Repository
@@ -27,14 +28,14 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 
-def verify_github_signature(payload_body: bytes, signature_header: str) -> bool:
-    """Verify GitHub webhook signature."""
+def verify_github_signature(payload_body: bytes, signature_header: str, secret: bytes) -> bool:
+    """Verify GitHub webhook signature in constant time."""
     if not signature_header:
         return False
     
     try:
         hash_object = hmac.new(
-            settings.GITHUB_WEBHOOK_SECRET.encode('utf-8'),
+            secret,
             msg=payload_body,
             digestmod=hashlib.sha256
         )
@@ -61,15 +62,17 @@ async def handle_github_webhook(
         # Get payload
         payload_body = await request.body()
         
-        # Verify signature if webhook secret is configured
-        if settings.GITHUB_WEBHOOK_SECRET:
+        # Verify signature if webhook secret is configured (served from the
+        # in-memory settings cache, not a per-delivery settings query)
+        webhook_secret = await get_webhook_secret(db)
+        if webhook_secret:
             if not signature_header:
                 track_api_call("webhook", "github", 401)
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Missing X-Hub-Signature-256 header"
                 )
-            if not verify_github_signature(payload_body, signature_header):
+            if not verify_github_signature(payload_body, signature_header, webhook_secret):
                 track_api_call("webhook", "github", 401)
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -42,6 +42,10 @@ class Settings(BaseSettings):
     DATABASE_MAX_OVERFLOW: int = Field(default=20, env="DATABASE_MAX_OVERFLOW")
     DATABASE_POOL_TIMEOUT: int = Field(default=30, env="DATABASE_POOL_TIMEOUT")
     DATABASE_POOL_RECYCLE: int = Field(default=3600, env="DATABASE_POOL_RECYCLE")
+    DATABASE_POOL_PRE_PING: bool = Field(default=True, env="DATABASE_POOL_PRE_PING")
+    DATABASE_TCP_KEEPALIVES_IDLE: int = Field(
+        default=30, env="DATABASE_TCP_KEEPALIVES_IDLE"
+    )
     DB_ECHO: bool = Field(default=False, env="DB_ECHO")
     
     # Redis Settings
@@ -287,7 +291,7 @@ def get_database_engine_config() -> dict:
         "max_overflow": settings.DATABASE_MAX_OVERFLOW,
         "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
         "pool_recycle": settings.DATABASE_POOL_RECYCLE,
-        "pool_pre_ping": True,  # Validate connections before use
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,  # Validate connections before use
         "echo": settings.DEBUG,  # Log SQL queries in debug mode
     }
 
@@ -3,16 +3,24 @@ Database configuration and session management for Cookie Licking Detector.
 Production-ready async database setup with connection pooling.
 """
 
+import asyncio
 import os
-from typing import AsyncGenerator
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+
+import orjson
+import structlog
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.pool import QueuePool, StaticPool
-from sqlalchemy import create_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
 
+logger = structlog.get_logger(__name__)
+
 # Base class for all models (can be imported without engine)
 Base = declarative_base()
 
@@ -20,6 +28,17 @@ Base = declarative_base()
 _engine = None
 _async_session_factory = None
 
+# Background connectivity check, so health probes don't take a pool slot
+DB_HEARTBEAT_INTERVAL = 5.0
+DB_HEARTBEAT_MAX_AGE = 10.0
+_last_db_ok: Optional[float] = None
+_heartbeat_task: Optional[asyncio.Task] = None
+
+def _orjson_serializer(value) -> str:
+    """Serialize JSON/JSONB bind values with orjson (int keys allowed, as with json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def get_engine():
     """Get or create database engine with lazy initialization"""
     global _engine
@@ -32,17 +51,26 @@ def get_engine():
             db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
         
         try:
-            # For async engines, don't use QueuePool - it's not compatible
+            # Explicit async-adapted queue pool; pre-ping and recycle drop
+            # connections that were silently closed by the server or a NAT
             _engine = create_async_engine(
                 db_url,
                 echo=settings.DB_ECHO,
+                poolclass=AsyncAdaptedQueuePool,
                 pool_size=settings.DATABASE_POOL_SIZE,
                 max_overflow=settings.DATABASE_MAX_OVERFLOW,
-                pool_pre_ping=True,
+                pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+                pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
                 pool_recycle=settings.DATABASE_POOL_RECYCLE,
+                # orjson instead of the stdlib json module for JSON/JSONB columns
+                json_serializer=_orjson_serializer,
+                json_deserializer=orjson.loads,
                 connect_args={
                     "server_settings": {
                         "application_name": "cookie-licking-detector",
+                        "tcp_keepalives_idle": str(settings.DATABASE_TCP_KEEPALIVES_IDLE),
+                        "tcp_keepalives_interval": "10",
+                        "tcp_keepalives_count": "5",
                     }
                 } if "postgresql" in db_url else {}
             )
@@ -93,6 +121,62 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def transaction(session: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Commit the session's transaction on success or roll it back on error.
+    Unlike session.begin(), this also works when a transaction has already
+    been autobegun by an earlier query on the same session (e.g. auth).
+    """
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def _db_heartbeat_loop():
+    """Periodically run SELECT 1 and record the time of the last success."""
+    global _last_db_ok
+    while True:
+        engine = get_engine()
+        if engine:
+            try:
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                _last_db_ok = time.monotonic()
+            except Exception as e:
+                # CancelledError is not an Exception, so stop_db_heartbeat
+                # still ends the loop
+                logger.warning("Database heartbeat failed", error=str(e))
+        await asyncio.sleep(DB_HEARTBEAT_INTERVAL)
+
+
+def start_db_heartbeat():
+    """Start the background database connectivity check."""
+    global _heartbeat_task
+    if _heartbeat_task is None or _heartbeat_task.done():
+        _heartbeat_task = asyncio.create_task(_db_heartbeat_loop())
+
+
+async def stop_db_heartbeat():
+    """Stop the background database connectivity check."""
+    global _heartbeat_task
+    if _heartbeat_task is not None:
+        _heartbeat_task.cancel()
+        try:
+            await _heartbeat_task
+        except asyncio.CancelledError:
+            pass
+        _heartbeat_task = None
+
+
+def is_db_healthy() -> bool:
+    """Whether the background check reached the database recently."""
+    return _last_db_ok is not None and time.monotonic() - _last_db_ok < DB_HEARTBEAT_MAX_AGE
+
+
 async def create_tables():
     """Create all database tables."""
     # Import all models to ensure they're registered with Base.metadata
@@ -125,8 +209,6 @@ async def close_db():
             await _engine.dispose()
     except Exception as e:
         # Log but don't raise - shutdown should continue
-        import logging
-        logger = logging.getLogger(__name__)
         logger.warning(f"Error disposing database engine during shutdown: {e}")
     finally:
         # Reset global variables
@@ -1,7 +1,8 @@
 import enum
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Text, JSON, Enum
-from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy.sql import func
+import hashlib
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Text, JSON, Enum, Index, LargeBinary
+from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
+from sqlalchemy.sql import func, text
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -15,12 +16,29 @@ class ClaimStatus(enum.Enum):
     RELEASED = "RELEASED"
     EXPIRED = "EXPIRED"
 
+def hash_claim_text(text: Optional[str]) -> Optional[bytes]:
+    """Normalized SHA-1 digest of a claim message, used to spot repeated messages"""
+    if not text:
+        return None
+    return hashlib.sha1(text.lower().strip().encode("utf-8")).digest()
+
 class Claim(Base):
     """
     Claims model as specified in MD file:
     claims table with confidence scoring and context metadata
     """
     __tablename__ = "claims"
+    __table_args__ = (
+        # Covering index for per-repository active claim counts
+        Index("ix_claims_repo_status", "repository_id", "status", postgresql_include=["id"]),
+        # Duplicate-message lookups per user
+        Index("ix_claims_user_text_hash", "github_user_id", "claim_text_hash"),
+        # Covering indexes for per-user rapid-claim and active claim counts
+        Index("ix_claims_user_created", "github_user_id", text("created_at DESC"), postgresql_include=["id"]),
+        Index("ix_claims_user_status", "github_user_id", "status", postgresql_include=["id"]),
+        # Covering index for per-repository contribution counts in conflict resolution
+        Index("ix_claims_repo_user_status", "repository_id", "github_username", "status", postgresql_include=["id"]),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     issue_id: Mapped[int] = mapped_column(
@@ -45,6 +63,7 @@ class Claim(Base):
     github_username: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     claim_comment_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     claim_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    claim_text_hash: Mapped[Optional[bytes]] = mapped_column(LargeBinary(20), nullable=True)  # see hash_claim_text
     claim_timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now(),
@@ -94,5 +113,11 @@ class Claim(Base):
     activity_logs = relationship("ActivityLog", back_populates="claim", cascade="all, delete-orphan", lazy="select")
     progress_tracking = relationship("ProgressTracking", back_populates="claim", uselist=False, cascade="all, delete-orphan", lazy="select")
 
+    @validates("claim_text")
+    def _sync_claim_text_hash(self, key, value):
+        """Keep claim_text_hash in step with claim_text"""
+        self.claim_text_hash = hash_claim_text(value)
+        return value
+
     def __repr__(self):
         return f"<Claim(id={self.id}, user='{self.github_username}', status='{self.status.value}')>"
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Boolean, JSON, DateTime, ForeignKey
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, JSON, DateTime, ForeignKey, literal
+from sqlalchemy.orm import relationship, Mapped, mapped_column, query_expression
 from sqlalchemy.sql import func
 from datetime import datetime, timezone
 from typing import Optional, List
@@ -12,6 +12,9 @@ class Repository(Base):
     repositories table with monitoring configuration
     """
     __tablename__ = "repositories"
+    # Fetch server-generated timestamps via RETURNING on INSERT/UPDATE so
+    # writes don't need a follow-up refresh
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     github_repo_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False, index=True)
@@ -44,6 +47,10 @@ class Repository(Base):
         nullable=False
     )
     
+    # Aggregate counts, populated per query with with_expression(); 0 otherwise
+    total_issues: Mapped[int] = query_expression(literal(0))
+    active_claims_count: Mapped[int] = query_expression(literal(0))
+    
     # Relationships - using lazy loading to avoid circular imports
     owner = relationship("User", back_populates="repositories", lazy="select")
     issues = relationship("Issue", back_populates="repository", cascade="all, delete-orphan", lazy="select")
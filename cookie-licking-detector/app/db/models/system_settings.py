@@ -2,7 +2,8 @@
 System Settings model for persistent configuration storage.
 Ensures multi-worker consistency by storing settings in database.
 """
-from sqlalchemy import Column, Integer, String, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from typing import Optional
@@ -27,14 +28,14 @@ class SystemSettings(Base):
     # Integration settings
     webhook_secret: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
-    # Notification settings (stored as JSON)
-    notification_settings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, default=dict)
+    # Notification settings (stored as JSONB)
+    notification_settings: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
     
-    # Rate limiting settings (stored as JSON)
-    rate_limiting: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, default=dict)
+    # Rate limiting settings (stored as JSONB)
+    rate_limiting: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
     
-    # GitHub integration settings (stored as JSON)
-    github_integration: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, default=dict)
+    # GitHub integration settings (stored as JSONB)
+    github_integration: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
 
     def __repr__(self):
         return f"<SystemSettings(id={self.id}, claim_timeout_hours={self.claim_timeout_hours})>"
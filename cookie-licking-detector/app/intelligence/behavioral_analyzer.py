@@ -11,26 +11,157 @@ Features:
 - Genuine contribution validation
 """
 
+import hashlib
+import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
 from dataclasses import dataclass
+import orjson
 import structlog
+from sqlalchemy import select, func, bindparam, literal
+from sqlalchemy.orm import aliased
+
+from app.db.models.claims import Claim, ClaimStatus, hash_claim_text
+
+try:
+    import hyperscan
+except ImportError:  # optional; bot detection falls back to the compiled regex
+    hyperscan = None
 
 logger = structlog.get_logger(__name__)
 
+# Recent analyses keyed by (github_user_id, digest of the other scoring
+# inputs), so repeated claims from the same user within the TTL skip the
+# database entirely. The
+# cache is per process: claims changed by Celery workers are not invalidated
+# here, so an analysis can be up to ANALYSIS_CACHE_TTL seconds stale
+ANALYSIS_CACHE_TTL = 60.0
+ANALYSIS_CACHE_MAX_SIZE = 4096
+_analysis_cache: Dict[Tuple[int, bytes], Tuple[float, "BehavioralAnalysis"]] = {}
+
+
+# Recommended action sets, shared by every analysis in the same bucket
+_REC_BOT = ('BLOCK_BOT_CLAIMS', 'ALERT_MAINTAINERS')
+_REC_HIGH_FRAUD = ('BLOCK_USER', 'REVIEW_ALL_ACTIVE_CLAIMS', 'NOTIFY_SECURITY_TEAM')
+_REC_MEDIUM_FRAUD = ('REQUIRE_MANUAL_APPROVAL', 'REDUCE_GRACE_PERIOD', 'INCREASE_MONITORING')
+_REC_COLLABORATIVE = ('ALLOW_TEAM_CLAIM', 'REQUEST_TEAM_MEMBERS')
+_REC_FLAG = ('FLAG_FOR_REVIEW', 'SEND_WARNING_MESSAGE')
+_REC_PROCEED = ('PROCEED_NORMALLY',)
+
+# Confidence by claim history length, saturating at 10 claims
+_CONF_TABLE = tuple(float(min(100, i * 10)) for i in range(11))
+
+# Rapid-claim window
+_ONE_HOUR = timedelta(hours=1)
+
+# Behavioral signal query, built once and bound per call:
+# (claims since :since, active claims, whether any earlier claim message
+# has the normalized hash :text_hash)
+_prior_claim = aliased(Claim)
+
+BEHAVIOR_SIGNALS_STMT = select(
+    func.count(Claim.id).filter(Claim.created_at >= bindparam("since")),
+    func.count(Claim.id).filter(Claim.status == ClaimStatus.ACTIVE),
+    select(literal(1)).where(
+        _prior_claim.github_user_id == bindparam("user_id"),
+        _prior_claim.claim_text_hash == bindparam("text_hash")
+    ).limit(1).exists()
+).where(
+    Claim.github_user_id == bindparam("user_id")
+)
+
+# Grouped variant for analyze_batch: per-user counts plus which of the
+# requested message hashes each user has posted before
+BATCH_SIGNALS_STMT = select(
+    Claim.github_user_id,
+    func.count(Claim.id).filter(Claim.created_at >= bindparam("since")),
+    func.count(Claim.id).filter(Claim.status == ClaimStatus.ACTIVE),
+    func.array_agg(Claim.claim_text_hash.distinct()).filter(
+        Claim.claim_text_hash.in_(bindparam("text_hashes", expanding=True))
+    )
+).where(
+    Claim.github_user_id.in_(bindparam("user_ids", expanding=True))
+).group_by(
+    Claim.github_user_id
+)
+
+
+def _analysis_cache_key(
+    github_user_id: int,
+    github_username: str,
+    claim_text: str,
+    issue_data: Dict,
+    claim_history: List[Dict]
+) -> Tuple[int, bytes]:
+    """
+    Cache key covering every scoring input: the user, the login (bot check),
+    the claim text, the issue data and the claim history fields the
+    detectors read (created_at and status)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(github_username.encode() + b'\0' + claim_text.encode() + b'\0')
+    digest.update(orjson.dumps(
+        issue_data,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str
+    ))
+    for claim in claim_history:
+        digest.update(f"\0{claim['created_at'].isoformat()}|{claim.get('status')}".encode())
+    return github_user_id, digest.digest()
+
 
-@dataclass
+def _store_analysis(key: Tuple[int, bytes], now: float, analysis: "BehavioralAnalysis") -> None:
+    """Cache an analysis, evicting the oldest entry when full"""
+    if len(_analysis_cache) >= ANALYSIS_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        _analysis_cache.pop(next(iter(_analysis_cache)))
+    _analysis_cache.pop(key, None)
+    _analysis_cache[key] = (now, analysis)
+
+
+def _compile_pattern_database(patterns: List[str]):
+    """Compile patterns into a Hyperscan block-mode database, or None if unavailable"""
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+        )
+        return database
+    except Exception as e:
+        logger.warning(f"Could not compile Hyperscan database, using re: {e}")
+        return None
+
+
+def invalidate_behavior_cache(github_user_id: Optional[int] = None) -> None:
+    """
+    Drop this process's cached analyses for one user (e.g. after a claim
+    status change made in this process), or all
+    """
+    if github_user_id is None:
+        _analysis_cache.clear()
+        return
+    for key in [key for key in _analysis_cache if key[0] == github_user_id]:
+        del _analysis_cache[key]
+
+
+@dataclass(slots=True, frozen=True)
 class BehavioralAnalysis:
-    """Behavioral pattern assessment"""
+    """Behavioral pattern assessment (immutable; cached instances are shared)"""
     is_suspicious: bool
-    anomalies: List[str]
+    anomalies: Tuple[str, ...]
     fraud_score: float  # 0-100, higher = more suspicious
     behavior_type: str  # GENUINE, COLLABORATIVE, SUSPICIOUS, FRAUDULENT
     is_bot: bool
     is_team_claim: bool
-    recommended_actions: List[str]
+    recommended_actions: Sequence[str]
     confidence: float
-    metadata: Dict
+    metadata: Mapping[str, float]  # read-only view
 
 
 class BehavioralAnalyzer:
@@ -48,6 +179,20 @@ class BehavioralAnalyzer:
         'identical_patterns': 0.9  # 90% similarity in messages
     }
     
+    # Fraud score contribution of each flagged detector
+    FRAUD_WEIGHTS = {
+        'rapid_claim': 20,
+        'hoarding': 25,
+        'abandon': 30,
+        'velocity': 15,
+        'identical': 20,
+        'bot': 0,  # reported as an anomaly, classified separately
+        'gaming': 25
+    }
+    
+    # Claim statuses that count as abandoned
+    ABANDONED_STATUSES = frozenset({'RELEASED', 'EXPIRED', 'AUTO_RELEASED'})
+    
     # Bot indicators
     BOT_PATTERNS = [
         r'\[bot\]',
@@ -56,12 +201,18 @@ class BehavioralAnalyzer:
         r'dependabot',
         r'renovate'
     ]
+    # Matched against casefolded input, so no IGNORECASE needed
+    _BOT_RE = re.compile('|'.join(BOT_PATTERNS))
+    _BOT_HS_DB = _compile_pattern_database(BOT_PATTERNS)
     
     # Collaboration keywords
     COLLABORATION_KEYWORDS = [
         'team', 'together', 'pair', 'collaborate',
         'we can', 'let\'s', 'help with', 'part of'
     ]
+    _COLLAB_RE = re.compile(
+        r'\b(?:' + '|'.join(map(re.escape, COLLABORATION_KEYWORDS)) + r')\b'
+    )
     
     def __init__(self, db_session):
         self.db = db_session
@@ -77,56 +228,160 @@ class BehavioralAnalyzer:
         """
         Comprehensive behavioral analysis
         Detects fraud, bots, and collaboration patterns
+        Results are cached per scoring inputs for ANALYSIS_CACHE_TTL seconds
+        """
+        
+        key = _analysis_cache_key(
+            github_user_id, github_username, claim_text, issue_data, claim_history
+        )
+        cached = _analysis_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < ANALYSIS_CACHE_TTL:
+            return cached[1]
+        
+        analysis = await self._analyze_claim_behavior(
+            github_user_id, github_username, claim_text, issue_data, claim_history
+        )
+        _store_analysis(key, now, analysis)
+        
+        return analysis
+    
+    async def analyze_batch(
+        self,
+        requests: List[Tuple[int, str, str, Dict, List[Dict]]]
+    ) -> List[BehavioralAnalysis]:
         """
+        Analyze many claims at once (webhook backfills, re-scoring runs)
+        
+        Each request is (github_user_id, github_username, claim_text,
+        issue_data, claim_history). Database signals for every uncached
+        request are fetched in a single grouped query; results are
+        returned in request order and cached like analyze_claim_behavior
+        """
+        
+        now = time.monotonic()
+        results: List[Optional[BehavioralAnalysis]] = [None] * len(requests)
+        pending = []
+        
+        for index, (user_id, username, claim_text, issue_data, claim_history) in enumerate(requests):
+            key = _analysis_cache_key(user_id, username, claim_text, issue_data, claim_history)
+            cached = _analysis_cache.get(key)
+            if cached is not None and now - cached[0] < ANALYSIS_CACHE_TTL:
+                results[index] = cached[1]
+                continue
+            
+            pending.append((index, key, claim_text.casefold(), hash_claim_text(claim_text)))
+        
+        if pending:
+            signals = await self._fetch_batch_signals(
+                {requests[index][0] for index, *_ in pending},
+                {text_hash for *_, text_hash in pending if text_hash is not None}
+            )
+            
+            for index, key, claim_text_lower, text_hash in pending:
+                user_id, username, _, issue_data, claim_history = requests[index]
+                rapid_claim_score, active_claims, user_hashes = signals.get(user_id, (0, 0, ()))
+                results[index] = self._score_claim(
+                    username,
+                    claim_text_lower,
+                    issue_data,
+                    claim_history,
+                    rapid_claim_score,
+                    active_claims,
+                    1.0 if text_hash in user_hashes else 0.0
+                )
+                _store_analysis(key, now, results[index])
+        
+        logger.info(
+            "Batch behavioral analysis complete",
+            requests=len(requests),
+            queried=len(pending)
+        )
+        
+        return results
+    
+    async def _analyze_claim_behavior(
+        self,
+        github_user_id: int,
+        github_username: str,
+        claim_text: str,
+        issue_data: Dict,
+        claim_history: List[Dict]
+    ) -> BehavioralAnalysis:
+        """Uncached behavioral analysis backing analyze_claim_behavior"""
         
         logger.info(f"Analyzing behavior for user {github_username}")
         
-        anomalies = []
-        fraud_score = 0.0
-        
-        # Check for rapid claiming
-        rapid_claim_score = await self._detect_rapid_claiming(github_user_id)
-        if rapid_claim_score > 0:
-            anomalies.append(f"Rapid claiming detected ({rapid_claim_score} claims/hour)")
-            fraud_score += 20
-        
-        # Check for claim hoarding
-        active_claims = await self._count_active_claims(github_user_id)
-        if active_claims > self.ANOMALY_THRESHOLDS['claim_hoarding']:
-            anomalies.append(f"Claim hoarding ({active_claims} active claims)")
-            fraud_score += 25
-        
-        # Check for serial abandonment
-        abandonment_rate = self._calculate_abandonment_rate(claim_history)
-        if abandonment_rate > 0.7:  # 70% abandonment rate
-            anomalies.append(f"High abandonment rate ({abandonment_rate*100:.1f}%)")
-            fraud_score += 30
-        
-        # Check for velocity anomalies
-        velocity_anomaly = self._detect_velocity_anomaly(claim_history)
-        if velocity_anomaly:
-            anomalies.append("Suspicious activity velocity spike")
-            fraud_score += 15
-        
-        # Check for copy-paste behavior
-        similarity_score = await self._detect_identical_patterns(github_user_id, claim_text)
-        if similarity_score > self.ANOMALY_THRESHOLDS['identical_patterns']:
-            anomalies.append("Repeated identical claim messages")
-            fraud_score += 20
-        
-        # Check if bot
-        is_bot = self._is_bot_account(github_username, claim_text)
-        if is_bot:
-            anomalies.append("Bot account detected")
+        # Rapid-claim count, active-claim count and message similarity come
+        # from a single database round trip
+        rapid_claim_score, active_claims, similarity_score = await self._fetch_behavior_signals(
+            github_user_id, claim_text
+        )
         
-        # Check for team collaboration
-        is_team_claim = self._detect_team_collaboration(claim_text, issue_data)
+        return self._score_claim(
+            github_username,
+            claim_text.casefold(),
+            issue_data,
+            claim_history,
+            rapid_claim_score,
+            active_claims,
+            similarity_score
+        )
+    
+    def _score_claim(
+        self,
+        github_username: str,
+        claim_text_lower: str,
+        issue_data: Dict,
+        claim_history: List[Dict],
+        rapid_claim_score: int,
+        active_claims: int,
+        similarity_score: float
+    ) -> BehavioralAnalysis:
+        """Score a claim from its database signals and claim history"""
         
-        # Check for gaming patterns
-        gaming_detected = self._detect_gaming_patterns(claim_history)
-        if gaming_detected:
-            anomalies.append("Gaming the system detected")
-            fraud_score += 25
+        # Abandonment count and claim-hour spread from one pass over history
+        abandoned_count, hour_mask = self._summarize_history(claim_history)
+        abandonment_rate = self._calculate_abandonment_rate(abandoned_count, len(claim_history))
+        
+        # Bot accounts are still scored; the flag changes classification and
+        # recommendations, not the fraud score
+        is_bot = self._is_bot_account(github_username, claim_text_lower)
+        
+        # Check for team collaboration
+        is_team_claim = self._detect_team_collaboration(claim_text_lower, issue_data)
+        
+        # Each detector yields (flagged, anomaly description), in report order
+        signals = {
+            'rapid_claim': (
+                rapid_claim_score > 0,
+                f"Rapid claiming detected ({rapid_claim_score} claims/hour)"
+            ),
+            'hoarding': (
+                active_claims > self.ANOMALY_THRESHOLDS['claim_hoarding'],
+                f"Claim hoarding ({active_claims} active claims)"
+            ),
+            'abandon': (
+                abandonment_rate > 0.7,  # 70% abandonment rate
+                f"High abandonment rate ({abandonment_rate*100:.1f}%)"
+            ),
+            'velocity': (
+                self._detect_velocity_anomaly(claim_history),
+                "Suspicious activity velocity spike"
+            ),
+            'identical': (
+                similarity_score > self.ANOMALY_THRESHOLDS['identical_patterns'],
+                "Repeated identical claim messages"
+            ),
+            'bot': (is_bot, "Bot account detected"),
+            'gaming': (
+                self._detect_gaming_patterns(hour_mask, len(claim_history)),
+                "Gaming the system detected"
+            ),
+        }
+        
+        fraud_score = float(sum(self.FRAUD_WEIGHTS[k] for k, (flag, _) in signals.items() if flag))
+        anomalies = tuple(detail for flag, detail in signals.values() if flag)
         
         # Determine behavior type
         behavior_type = self._classify_behavior(
@@ -144,8 +399,8 @@ class BehavioralAnalyzer:
             behavior_type=behavior_type
         )
         
-        # Calculate confidence
-        confidence = min(100.0, len(claim_history) * 10)  # More history = more confidence
+        # More history = more confidence
+        confidence = _CONF_TABLE[min(len(claim_history), 10)]
         
         logger.info(
             f"Behavioral analysis complete for {github_username}",
@@ -162,90 +417,112 @@ class BehavioralAnalyzer:
             is_bot=is_bot,
             is_team_claim=is_team_claim,
             recommended_actions=recommendations,
-            confidence=round(confidence, 2),
-            metadata={
+            confidence=confidence,
+            metadata=MappingProxyType({
                 'active_claims': active_claims,
                 'abandonment_rate': round(abandonment_rate, 2),
                 'similarity_score': round(similarity_score, 2),
                 'rapid_claim_score': rapid_claim_score
-            }
+            })
         )
     
-    async def _detect_rapid_claiming(self, user_id: int) -> float:
-        """Detect if user is claiming issues too rapidly"""
+    async def _fetch_behavior_signals(self, user_id: int, current_text: str) -> Tuple[int, int, float]:
+        """
+        Fetch rapid-claim count, active-claim count and message similarity in
+        one query, returning (claims_last_hour, active_claims, similarity)
+        
+        Similarity is 1.0 when the user has posted an identical (normalized)
+        claim message before, otherwise 0.0
+        """
         
         try:
-            from app.db.models.claims import Claim
-            from sqlalchemy import select, func
-            
             # Check claims in last hour
-            one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+            one_hour_ago = datetime.now(timezone.utc) - _ONE_HOUR
             
-            stmt = select(func.count(Claim.id)).where(
-                Claim.github_user_id == user_id,
-                Claim.created_at >= one_hour_ago
-            )
+            result = await self.db.execute(BEHAVIOR_SIGNALS_STMT, {
+                "user_id": user_id,
+                "since": one_hour_ago,
+                "text_hash": hash_claim_text(current_text)
+            })
+            claims_last_hour, active_claims, has_identical = result.one()
             
-            result = await self.db.execute(stmt)
-            claims_last_hour = result.scalar() or 0
-            
-            return claims_last_hour
+            return claims_last_hour or 0, active_claims or 0, 1.0 if has_identical else 0.0
             
         except Exception as e:
-            logger.warning(f"Could not detect rapid claiming: {e}")
-            return 0
+            logger.warning(f"Could not fetch behavior signals: {e}")
+            return 0, 0, 0.0
     
-    async def _count_active_claims(self, user_id: int) -> int:
-        """Count currently active claims"""
+    async def _fetch_batch_signals(
+        self,
+        user_ids: Set[int],
+        text_hashes: Set[bytes]
+    ) -> Dict[int, Tuple[int, int, Set[bytes]]]:
+        """
+        Fetch behavior signals for many users in one grouped query, returning
+        {github_user_id: (claims_last_hour, active_claims, matching_hashes)}
+        where matching_hashes are those of text_hashes the user has posted
+        """
         
         try:
-            from app.db.models.claims import Claim, ClaimStatus
-            from sqlalchemy import select, func
+            one_hour_ago = datetime.now(timezone.utc) - _ONE_HOUR
             
-            stmt = select(func.count(Claim.id)).where(
-                Claim.github_user_id == user_id,
-                Claim.status == ClaimStatus.ACTIVE
-            )
+            result = await self.db.execute(BATCH_SIGNALS_STMT, {
+                "user_ids": list(user_ids),
+                "since": one_hour_ago,
+                "text_hashes": list(text_hashes)
+            })
             
-            result = await self.db.execute(stmt)
-            return result.scalar() or 0
+            return {
+                user_id: (claims_last_hour or 0, active_claims or 0, set(hashes or ()))
+                for user_id, claims_last_hour, active_claims, hashes in result
+            }
             
         except Exception as e:
-            logger.warning(f"Could not count active claims: {e}")
-            return 0
+            logger.warning(f"Could not fetch batch behavior signals: {e}")
+            return {}
+    
+    def _summarize_history(self, claim_history: List[Dict]) -> Tuple[int, int]:
+        """
+        Single pass over claim history returning the number of abandoned
+        claims and a 24-bit mask of the hours of day claims were made in
+        """
+        
+        abandoned_statuses = self.ABANDONED_STATUSES
+        abandoned = 0
+        hour_mask = 0
+        for claim in claim_history:
+            hour_mask |= 1 << claim['created_at'].hour
+            if claim.get('status') in abandoned_statuses:
+                abandoned += 1
+        
+        return abandoned, hour_mask
     
-    def _calculate_abandonment_rate(self, claim_history: List[Dict]) -> float:
+    def _calculate_abandonment_rate(self, abandoned_count: int, total_claims: int) -> float:
         """Calculate percentage of abandoned claims"""
         
-        if not claim_history:
+        if not total_claims:
             return 0.0
         
-        abandoned = len([
-            c for c in claim_history
-            if c.get('status') in ['RELEASED', 'EXPIRED', 'AUTO_RELEASED']
-        ])
-        
-        return abandoned / len(claim_history)
+        return abandoned_count / total_claims
     
     def _detect_velocity_anomaly(self, claim_history: List[Dict]) -> bool:
         """Detect sudden spikes in activity (possible automation)"""
         
-        if len(claim_history) < 10:
+        total = len(claim_history)
+        if total < 10:
             return False
         
-        # Calculate recent vs historical velocity
-        recent = claim_history[:5]
-        historical = claim_history[5:]
-        
-        if not recent or not historical:
-            return False
+        # Recent window is the first 5 claims, historical is the rest; only
+        # the boundary timestamps are needed, so index instead of slicing
+        recent_count = 5
+        historical_count = total - recent_count
         
         # Calculate time spans
-        recent_span = (recent[0]['created_at'] - recent[-1]['created_at']).days or 1
-        historical_span = (historical[0]['created_at'] - historical[-1]['created_at']).days or 1
+        recent_span = (claim_history[0]['created_at'] - claim_history[recent_count - 1]['created_at']).days or 1
+        historical_span = (claim_history[recent_count]['created_at'] - claim_history[-1]['created_at']).days or 1
         
-        recent_velocity = len(recent) / recent_span
-        historical_velocity = len(historical) / historical_span
+        recent_velocity = recent_count / recent_span
+        historical_velocity = historical_count / historical_span
         
         # Check for 10x spike
         if recent_velocity > historical_velocity * self.ANOMALY_THRESHOLDS['velocity_spike']:
@@ -253,71 +530,36 @@ class BehavioralAnalyzer:
         
         return False
     
-    async def _detect_identical_patterns(self, user_id: int, current_text: str) -> float:
-        """Detect if user copy-pastes same claim message"""
-        
-        try:
-            from app.db.models.claims import Claim
-            from sqlalchemy import select
-            
-            # Get recent claims
-            stmt = select(Claim.claim_text).where(
-                Claim.github_user_id == user_id
-            ).limit(10)
-            
-            result = await self.db.execute(stmt)
-            past_texts = [row[0] for row in result.all() if row[0]]
-            
-            if not past_texts:
-                return 0.0
-            
-            # Simple similarity check (in production, use ML similarity)
-            current_lower = current_text.lower().strip()
-            matches = sum(1 for text in past_texts if text.lower().strip() == current_lower)
-            
-            return matches / len(past_texts)
-            
-        except Exception as e:
-            logger.warning(f"Could not detect identical patterns: {e}")
-            return 0.0
-    
-    def _is_bot_account(self, username: str, claim_text: str) -> bool:
-        """Detect if this is a bot account"""
-        
-        import re
-        
-        # Check username
-        username_lower = username.lower()
-        for pattern in self.BOT_PATTERNS:
-            if re.search(pattern, username_lower):
-                return True
-        
-        # Check claim text
-        text_lower = claim_text.lower()
-        for pattern in self.BOT_PATTERNS:
-            if re.search(pattern, text_lower):
-                return True
+    def _is_bot_account(self, username: str, claim_text_lower: str) -> bool:
+        """Detect if this is a bot account (claim text must be casefolded)"""
+        
+        if self._BOT_HS_DB is not None:
+            # One DFA scan over username and text; the NUL separator keeps
+            # a match from spanning the two
+            matched = []
+            self._BOT_HS_DB.scan(
+                username.casefold().encode() + b'\0' + claim_text_lower.encode(),
+                match_event_handler=lambda *_: matched.append(True)
+            )
+            return bool(matched)
         
-        return False
+        return bool(self._BOT_RE.search(username.casefold()) or self._BOT_RE.search(claim_text_lower))
     
-    def _detect_team_collaboration(self, claim_text: str, issue_data: Dict) -> bool:
-        """Detect if this is a team collaboration claim"""
-        
-        text_lower = claim_text.lower()
+    def _detect_team_collaboration(self, claim_text_lower: str, issue_data: Dict) -> bool:
+        """Detect if this is a team collaboration claim (claim text must be casefolded)"""
         
         # Check for collaboration keywords
-        for keyword in self.COLLABORATION_KEYWORDS:
-            if keyword in text_lower:
-                return True
+        if self._COLLAB_RE.search(claim_text_lower):
+            return True
         
         # Check for multiple @ mentions
-        mention_count = claim_text.count('@')
+        mention_count = claim_text_lower.count('@')
         if mention_count >= 2:
             return True
         
         return False
     
-    def _detect_gaming_patterns(self, claim_history: List[Dict]) -> bool:
+    def _detect_gaming_patterns(self, hour_mask: int, total_claims: int) -> bool:
         """
         Detect gaming patterns:
         - Claiming easy issues only
@@ -325,7 +567,7 @@ class BehavioralAnalyzer:
         - Claiming multiple repos simultaneously
         """
         
-        if len(claim_history) < 5:
+        if total_claims < 5:
             return False
         
         # Check if only claiming "good first issue" type work
@@ -333,11 +575,9 @@ class BehavioralAnalyzer:
         # Placeholder for now
         
         # Check time-based gaming (claiming at specific times)
-        claim_hours = [c['created_at'].hour for c in claim_history]
-        
         # If all claims at same hour (automation/scripting)
-        unique_hours = len(set(claim_hours))
-        if unique_hours <= 2 and len(claim_history) > 5:
+        unique_hours = hour_mask.bit_count()
+        if unique_hours <= 2 and total_claims > 5:
             return True
         
         return False
@@ -368,40 +608,28 @@ class BehavioralAnalyzer:
     def _generate_recommendations(
         self,
         fraud_score: float,
-        anomalies: List[str],
+        anomalies: Sequence[str],
         is_bot: bool,
         behavior_type: str
-    ) -> List[str]:
-        """Generate action recommendations based on analysis"""
-        
-        recommendations = []
+    ) -> Sequence[str]:
+        """Generate action recommendations based on analysis (shared, immutable)"""
         
         if is_bot:
-            recommendations.append('BLOCK_BOT_CLAIMS')
-            recommendations.append('ALERT_MAINTAINERS')
-        
-        elif fraud_score > 70:
-            recommendations.append('BLOCK_USER')
-            recommendations.append('REVIEW_ALL_ACTIVE_CLAIMS')
-            recommendations.append('NOTIFY_SECURITY_TEAM')
+            return _REC_BOT
         
-        elif fraud_score > 50:
-            recommendations.append('REQUIRE_MANUAL_APPROVAL')
-            recommendations.append('REDUCE_GRACE_PERIOD')
-            recommendations.append('INCREASE_MONITORING')
+        if fraud_score > 70:
+            return _REC_HIGH_FRAUD
         
-        elif behavior_type == 'COLLABORATIVE':
-            recommendations.append('ALLOW_TEAM_CLAIM')
-            recommendations.append('REQUEST_TEAM_MEMBERS')
+        if fraud_score > 50:
+            return _REC_MEDIUM_FRAUD
         
-        elif len(anomalies) > 2:
-            recommendations.append('FLAG_FOR_REVIEW')
-            recommendations.append('SEND_WARNING_MESSAGE')
+        if behavior_type == 'COLLABORATIVE':
+            return _REC_COLLABORATIVE
         
-        else:
-            recommendations.append('PROCEED_NORMALLY')
+        if len(anomalies) > 2:
+            return _REC_FLAG
         
-        return recommendations
+        return _REC_PROCEED
     
     def should_block_claim(self, analysis: BehavioralAnalysis) -> bool:
         """Determine if claim should be blocked"""
@@ -11,25 +11,150 @@ Features:
 - Contribution diversity optimization
 """
 
+import dataclasses
+import functools
+import hashlib
+import heapq
+import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import structlog
+from sqlalchemy import bindparam, func, select
+
+from app.db.models.claims import Claim, ClaimStatus
+
+try:
+    import ahocorasick
+except ImportError:  # optional; keyword scans fall back to the compiled regex
+    ahocorasick = None
 
 logger = structlog.get_logger(__name__)
 
+# Reputation results keyed by (github_user_id, username), so users involved
+# in several conflicts within the TTL are only scored once
+REPUTATION_CACHE_TTL = 300.0
+REPUTATION_CACHE_MAX_SIZE = 4096
+_reputation_cache: Dict[Tuple[int, str], Tuple[float, 'ReputationScore']] = {}
 
-@dataclass
+# Resolutions keyed by a digest of (repository, issue, claimers, claim text),
+# so redelivered webhooks for the same conflict reuse the first result
+RESOLUTION_CACHE_TTL = 120.0
+RESOLUTION_CACHE_MAX_SIZE = 2048
+_resolution_cache: Dict[bytes, Tuple[float, 'ConflictResolution']] = {}
+
+# Completed claims per user in one repository, counting at most :cap per
+# user (the contribution score saturates there) via a per-user row number
+_ranked_completed = select(
+    Claim.github_username,
+    func.row_number().over(
+        partition_by=Claim.github_username,
+        order_by=Claim.id
+    ).label('rank')
+).where(
+    Claim.repository_id == bindparam("repository_id"),
+    Claim.github_username.in_(bindparam("usernames", expanding=True)),
+    Claim.status == ClaimStatus.COMPLETED
+).subquery()
+
+CONTRIBUTION_COUNTS_STMT = select(
+    _ranked_completed.c.github_username,
+    func.count()
+).where(
+    _ranked_completed.c.rank <= bindparam("cap")
+).group_by(
+    _ranked_completed.c.github_username
+)
+
+# Issue label tiers for complexity assessment, checked hardest first
+_VERY_HARD_LABELS = frozenset({'blocker', 'critical'})
+_HARD_LABELS = frozenset({'enhancement', 'feature'})
+_MEDIUM_LABELS = frozenset({'bug', 'improvement'})
+_EASY_LABELS = frozenset({'good first issue', 'documentation'})
+
+# Generic work split suggestion, read-only since every resolution shares it
+_DEFAULT_SPLIT = (
+    MappingProxyType({
+        'task': 'Implementation',
+        'description': 'Core functionality implementation',
+        'estimated_effort': 'HIGH'
+    }),
+    MappingProxyType({
+        'task': 'Testing',
+        'description': 'Write comprehensive tests',
+        'estimated_effort': 'MEDIUM'
+    }),
+    MappingProxyType({
+        'task': 'Documentation',
+        'description': 'Update documentation and examples',
+        'estimated_effort': 'LOW'
+    })
+)
+
+
+def _build_keyword_automaton(keywords: List[str]):
+    """Build an Aho-Corasick automaton over lowercase keywords, or None if unavailable"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword.lower())
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Same character class as the regex \\w"""
+    return char.isalnum() or char == '_'
+
+
+def _has_keyword(automaton, text: str) -> bool:
+    """
+    True if any keyword occurs in text as a whole word, matching the \\b
+    boundaries of the regex fallback
+    """
+    for end, keyword in automaton.iter(text):
+        start = end - len(keyword) + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=1024)
+def _maintainer_set(maintainers: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercased maintainer logins, memoized per maintainer list"""
+    return frozenset(m.lower() for m in maintainers)
+
+
+@dataclass(slots=True, frozen=True)
 class ConflictResolution:
-    """Conflict resolution recommendation"""
-    winner: Optional[str]  # GitHub username
+    """Conflict resolution recommendation (immutable; cached instances are shared)"""
+    winner: Optional[str]  # claimer role ('existing', 'new', 'new_N'), None if undecided
     resolution_strategy: str
     reasoning: str
-    priority_scores: Dict[str, float]
+    priority_scores: Mapping[str, float]
     should_allow_both: bool  # For team claims
-    recommended_split: Optional[List[Dict]]  # How to split work
+    recommended_split: Optional[Sequence[Mapping]]  # How to split work
     confidence: float
-    metadata: Dict
+    metadata: Mapping
+    
+    def __post_init__(self):
+        # Wrap the mappings in read-only views so no caller can change what
+        # later cache hits see
+        object.__setattr__(self, 'priority_scores', MappingProxyType(dict(self.priority_scores)))
+        object.__setattr__(self, 'metadata', MappingProxyType(dict(self.metadata)))
+
+
+@dataclass
+class RepoContext:
+    """Repository data shared by every conflict resolved in that repository"""
+    maintainers: FrozenSet[str]  # Lowercased GitHub usernames
+    contributions: Dict[str, float]  # Username -> contribution score (0-100)
 
 
 class ClaimConflictResolver:
@@ -49,6 +174,16 @@ class ClaimConflictResolver:
         'diversity_factor': 0.05
     }
     
+    # Fixed-value components, pre-scaled by their weights
+    _RESPONSE_EXISTING = 100 * PRIORITY_WEIGHTS['response_speed']
+    _RESPONSE_NEW = 70 * PRIORITY_WEIGHTS['response_speed']
+    _TIME_EXISTING = 100 * PRIORITY_WEIGHTS['time_priority']
+    _TIME_NEW = 50 * PRIORITY_WEIGHTS['time_priority']
+    _MAINTAINER_YES = 100 * PRIORITY_WEIGHTS['maintainer_preference']
+    _MAINTAINER_NO = 50 * PRIORITY_WEIGHTS['maintainer_preference']
+    _DIVERSITY_NEW = 80 * PRIORITY_WEIGHTS['diversity_factor']
+    _DIVERSITY_ESTABLISHED = 50 * PRIORITY_WEIGHTS['diversity_factor']
+    
     # Resolution strategies
     STRATEGIES = {
         'FIRST_COME': 'First claimer gets priority',
@@ -59,6 +194,20 @@ class ClaimConflictResolver:
         'MAINTAINER_CHOICE': 'Let maintainer decide'
     }
     
+    # Collaboration intent: an @mention or any collaboration phrase
+    COLLABORATION_PHRASES = [
+        'help', 'assist', 'collaborate', 'together', 'team up',
+        'work with', 'join', 'contribute to', 'part of'
+    ]
+    _COLLAB_RE = re.compile(
+        r'@|\b(?:' + '|'.join(map(re.escape, COLLABORATION_PHRASES)) + r')\b',
+        re.IGNORECASE
+    )
+    _COLLAB_AUTOMATON = _build_keyword_automaton(COLLABORATION_PHRASES)
+    
+    # Completed claims at which the contribution score saturates (10 points each)
+    CONTRIBUTION_SCORE_CAP = 10
+    
     def __init__(self, db_session, reputation_engine):
         self.db = db_session
         self.reputation_engine = reputation_engine
@@ -69,7 +218,9 @@ class ClaimConflictResolver:
         repository_data: Dict,
         existing_claim: Dict,
         new_claimer: Dict,
-        new_claim_text: str
+        new_claim_text: str,
+        repo_context: Optional['RepoContext'] = None,
+        new_claim_created_at: Optional[datetime] = None
     ) -> ConflictResolution:
         """
         Resolve conflict between existing and new claimer
@@ -80,26 +231,92 @@ class ClaimConflictResolver:
         3. Response time
         4. Contribution history in repo
         5. Team collaboration potential
+        
+        When resolving many conflicts in one repository, pass a repo_context
+        from build_repo_context covering all claimers to skip the
+        per-conflict contribution query. new_claim_created_at should be the
+        claim comment's timestamp when the caller has it; it defaults to now
+        
+        Results are cached per (repository, issue, existing claimer, new
+        claimer, claim text) for RESOLUTION_CACHE_TTL seconds, so redelivered
+        webhooks are answered without recomputation
         """
         
+        key = hashlib.blake2b(
+            '\0'.join((
+                str(repository_data.get('id')),
+                str(issue_data['github_issue_number']),
+                existing_claim['github_username'],
+                new_claimer['username'],
+                new_claim_text
+            )).encode(),
+            digest_size=16
+        ).digest()
+        cached = _resolution_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < RESOLUTION_CACHE_TTL:
+            return cached[1]
+        
+        resolution = await self._resolve_conflict(
+            issue_data,
+            repository_data,
+            existing_claim,
+            new_claimer,
+            new_claim_text,
+            repo_context,
+            new_claim_created_at
+        )
+        
+        if len(_resolution_cache) >= RESOLUTION_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _resolution_cache.pop(next(iter(_resolution_cache)))
+        _resolution_cache.pop(key, None)
+        _resolution_cache[key] = (now, resolution)
+        
+        return resolution
+    
+    async def _resolve_conflict(
+        self,
+        issue_data: Dict,
+        repository_data: Dict,
+        existing_claim: Dict,
+        new_claimer: Dict,
+        new_claim_text: str,
+        repo_context: Optional['RepoContext'],
+        new_claim_created_at: Optional[datetime]
+    ) -> ConflictResolution:
+        """Uncached conflict resolution backing resolve_conflict"""
+        
+        new_claim_ts = new_claim_created_at or datetime.now(timezone.utc)
+        
         logger.info(
             f"Resolving conflict for issue #{issue_data['github_issue_number']}",
             existing=existing_claim['github_username'],
             new=new_claimer['username']
         )
         
-        # Get reputation scores
-        existing_reputation = await self.reputation_engine.calculate_reputation(
+        # Get reputation scores. These stay sequential: the reputation engine
+        # and this resolver may share one AsyncSession, which does not allow
+        # concurrent operations
+        existing_reputation = await self._cached_reputation(
             existing_claim['github_user_id'],
             existing_claim['github_username']
         )
         
-        new_reputation = await self.reputation_engine.calculate_reputation(
+        new_reputation = await self._cached_reputation(
             new_claimer['user_id'],
             new_claimer['username']
         )
         
-        # Calculate priority scores for each claimer
+        # Maintainers and completed-claim counts for both claimers in one query
+        if repo_context is None:
+            repo_context = await self.build_repo_context(
+                repository_data,
+                [existing_claim['github_username'], new_claimer['username']]
+            )
+        
+        # Calculate priority scores for each claimer. Scoring does no I/O,
+        # so awaiting them in turn costs nothing over gathering them
         existing_score = await self._calculate_priority_score(
             user_id=existing_claim['github_user_id'],
             username=existing_claim['github_username'],
@@ -107,16 +324,17 @@ class ClaimConflictResolver:
             claim_data=existing_claim,
             issue_data=issue_data,
             repository_data=repository_data,
+            repo_context=repo_context,
             is_existing=True
         )
-        
         new_score = await self._calculate_priority_score(
             user_id=new_claimer['user_id'],
             username=new_claimer['username'],
             reputation=new_reputation,
-            claim_data={'claim_text': new_claim_text, 'created_at': datetime.now(timezone.utc)},
+            claim_data={'claim_text': new_claim_text, 'created_at': new_claim_ts},
             issue_data=issue_data,
             repository_data=repository_data,
+            repo_context=repo_context,
             is_existing=False
         )
         
@@ -137,13 +355,164 @@ class ClaimConflictResolver:
         )
         
         logger.info(
-            f"Conflict resolution: {resolution['strategy']}",
+            f"Conflict resolution: {resolution.resolution_strategy}",
             existing_score=existing_score,
             new_score=new_score
         )
         
         return resolution
     
+    async def resolve_batch(self, conflicts: List[Dict]) -> List[ConflictResolution]:
+        """
+        Resolve many queued conflicts (e.g. a nightly re-resolution run)
+        
+        Each conflict is a dict of resolve_conflict keyword arguments. One
+        repository context is built per repository for all of its claimers,
+        so contribution counts cost one query per repository rather than one
+        per conflict. Results are returned in input order
+        """
+        
+        usernames_by_repo: Dict[Optional[int], Dict[str, None]] = {}
+        repository_by_id: Dict[Optional[int], Dict] = {}
+        for conflict in conflicts:
+            repo_id = conflict['repository_data'].get('id')
+            repository_by_id.setdefault(repo_id, conflict['repository_data'])
+            usernames = usernames_by_repo.setdefault(repo_id, {})
+            usernames[conflict['existing_claim']['github_username']] = None
+            usernames[conflict['new_claimer']['username']] = None
+        
+        contexts = {
+            repo_id: await self.build_repo_context(repository_by_id[repo_id], list(usernames))
+            for repo_id, usernames in usernames_by_repo.items()
+        }
+        
+        return [
+            await self.resolve_conflict(
+                **conflict,
+                repo_context=contexts[conflict['repository_data'].get('id')]
+            )
+            for conflict in conflicts
+        ]
+    
+    async def resolve_multi_conflict(
+        self,
+        issue_data: Dict,
+        repository_data: Dict,
+        claimants: List[Dict]
+    ) -> ConflictResolution:
+        """
+        Resolve a conflict between any number of claimers
+        
+        claimants are dicts with user_id, username, claim_text and created_at,
+        ordered by claim time. Every claimer gets a role: 'existing' for the
+        first, then 'new' (two claimers) or 'new_1', 'new_2', ... in claim
+        order. The two highest-scoring claimers are then resolved by the same
+        strategy as resolve_conflict, the earlier of them in the existing
+        claimer's place. winner and priority_scores use the roles;
+        metadata['claimer_roles'] maps each role to its username and
+        metadata['contenders'] names the two roles that were compared
+        """
+        
+        if len(claimants) < 2:
+            raise ValueError("resolve_multi_conflict needs at least two claimants")
+        
+        logger.info(
+            f"Resolving {len(claimants)}-way conflict for issue #{issue_data['github_issue_number']}",
+            claimants=[c['username'] for c in claimants]
+        )
+        
+        repo_context = await self.build_repo_context(
+            repository_data,
+            [c['username'] for c in claimants]
+        )
+        
+        # Sequential for the same reason as in resolve_conflict
+        reputations = [
+            await self._cached_reputation(c['user_id'], c['username'])
+            for c in claimants
+        ]
+        
+        scores = [
+            await self._calculate_priority_score(
+                user_id=claimant['user_id'],
+                username=claimant['username'],
+                reputation=reputation,
+                claim_data=claimant,
+                issue_data=issue_data,
+                repository_data=repository_data,
+                repo_context=repo_context,
+                is_existing=index == 0
+            )
+            for index, (claimant, reputation) in enumerate(zip(claimants, reputations))
+        ]
+        
+        if len(claimants) == 2:
+            roles = ['existing', 'new']
+        else:
+            roles = ['existing'] + [f'new_{index}' for index in range(1, len(claimants))]
+        priority_scores = dict(zip(roles, scores))
+        
+        # Top two claimers by score (ties go to the earlier claim), passed
+        # to the shared strategy in claim order
+        first, second = heapq.nlargest(2, range(len(scores)), key=lambda i: (scores[i], -i))
+        earlier, later = sorted((first, second))
+        
+        resolution = self._determine_resolution_strategy(
+            existing_score=scores[earlier],
+            new_score=scores[later],
+            existing_reputation=reputations[earlier],
+            new_reputation=reputations[later],
+            is_collaboration=self._detect_collaboration_intent(
+                claimants[earlier]['claim_text'],
+                claimants[later]['claim_text']
+            ),
+            issue_data=issue_data,
+            roles=(roles[earlier], roles[later]),
+            priority_scores=priority_scores
+        )
+        
+        return dataclasses.replace(resolution, metadata={
+            **resolution.metadata,
+            'claimer_roles': MappingProxyType({role: c['username'] for role, c in zip(roles, claimants)}),
+            'contenders': (roles[earlier], roles[later])
+        })
+    
+    async def build_repo_context(self, repository_data: Dict, usernames: List[str]) -> 'RepoContext':
+        """
+        Gather per-repository data for resolving conflicts among usernames:
+        maintainer set plus completed-claim scores from one grouped query
+        """
+        
+        # This would check GitHub permissions
+        # For now, simplified check
+        maintainers = _maintainer_set(tuple(repository_data.get('maintainers', ())))
+        
+        contributions = await self._get_repo_contribution_scores(
+            usernames=usernames,
+            repository_data=repository_data
+        )
+        
+        return RepoContext(maintainers=maintainers, contributions=contributions)
+    
+    async def _cached_reputation(self, user_id: int, username: str) -> 'ReputationScore':
+        """Reputation for a user, reused across conflicts for REPUTATION_CACHE_TTL seconds"""
+        
+        key = (user_id, username)
+        cached = _reputation_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < REPUTATION_CACHE_TTL:
+            return cached[1]
+        
+        reputation = await self.reputation_engine.calculate_reputation(user_id, username)
+        
+        if len(_reputation_cache) >= REPUTATION_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _reputation_cache.pop(next(iter(_reputation_cache)))
+        _reputation_cache.pop(key, None)
+        _reputation_cache[key] = (now, reputation)
+        
+        return reputation
+    
     async def _calculate_priority_score(
         self,
         user_id: int,
@@ -152,6 +521,7 @@ class ClaimConflictResolver:
         claim_data: Dict,
         issue_data: Dict,
         repository_data: Dict,
+        repo_context: 'RepoContext',
         is_existing: bool
     ) -> float:
         """Calculate comprehensive priority score (0-100)"""
@@ -174,44 +544,23 @@ class ClaimConflictResolver:
         score += skill_component
         
         # Component 3: Response speed (15%)
-        if is_existing:
-            # Existing claimer gets full response points
-            response_component = 100 * self.PRIORITY_WEIGHTS['response_speed']
-        else:
-            # New claimer gets points based on how quickly they responded
-            response_component = 70 * self.PRIORITY_WEIGHTS['response_speed']
-        score += response_component
+        # Existing claimer gets full response points, new claimer partial
+        score += self._RESPONSE_EXISTING if is_existing else self._RESPONSE_NEW
         
         # Component 4: Contribution history in this repo (15%)
-        contribution_history = await self._get_repo_contribution_score(
-            username=username,
-            repository_data=repository_data
-        )
-        contribution_component = contribution_history * self.PRIORITY_WEIGHTS['contribution_history']
-        score += contribution_component
+        contribution_history = repo_context.contributions.get(username, 0.0)
+        score += contribution_history * self.PRIORITY_WEIGHTS['contribution_history']
         
         # Component 5: Time priority (10%)
-        if is_existing:
-            time_component = 100 * self.PRIORITY_WEIGHTS['time_priority']
-        else:
-            time_component = 50 * self.PRIORITY_WEIGHTS['time_priority']
-        score += time_component
+        score += self._TIME_EXISTING if is_existing else self._TIME_NEW
         
         # Component 6: Maintainer status (10%)
-        is_maintainer = await self._is_maintainer(username, repository_data)
-        if is_maintainer:
-            maintainer_component = 100 * self.PRIORITY_WEIGHTS['maintainer_preference']
-        else:
-            maintainer_component = 50 * self.PRIORITY_WEIGHTS['maintainer_preference']
-        score += maintainer_component
+        is_maintainer = self._is_maintainer(username, repo_context)
+        score += self._MAINTAINER_YES if is_maintainer else self._MAINTAINER_NO
         
         # Component 7: Diversity factor (5%)
         # Encourage new contributors
-        if reputation.total_claims < 3:
-            diversity_component = 80 * self.PRIORITY_WEIGHTS['diversity_factor']
-        else:
-            diversity_component = 50 * self.PRIORITY_WEIGHTS['diversity_factor']
-        score += diversity_component
+        score += self._DIVERSITY_NEW if reputation.total_claims < 3 else self._DIVERSITY_ESTABLISHED
         
         return min(100.0, max(0.0, score))
     
@@ -242,45 +591,41 @@ class ClaimConflictResolver:
             logger.warning(f"Could not calculate skill match: {e}")
             return 50.0
     
-    async def _get_repo_contribution_score(
+    async def _get_repo_contribution_scores(
         self,
-        username: str,
+        usernames: List[str],
         repository_data: Dict
-    ) -> float:
+    ) -> Dict[str, float]:
         """
-        Score based on user's past contributions to this specific repo
+        Score each user's past contributions to this specific repo
         Higher score for established contributors
         """
         
+        if not usernames:
+            return {}
+        
         try:
-            from app.db.models.claims import Claim
-            from sqlalchemy import select, func
+            result = await self.db.execute(CONTRIBUTION_COUNTS_STMT, {
+                "repository_id": repository_data.get('id'),
+                "usernames": list(dict.fromkeys(usernames)),
+                "cap": self.CONTRIBUTION_SCORE_CAP
+            })
             
-            # Count completed claims in this repo
-            stmt = select(func.count(Claim.id)).where(
-                Claim.github_username == username,
-                Claim.repository_id == repository_data.get('id'),
-                Claim.status == 'COMPLETED'
-            )
-            
-            result = await self.db.execute(stmt)
-            completed_count = result.scalar() or 0
-            
-            # Score: 10 points per completed claim, max 100
-            return min(100.0, completed_count * 10)
+            # Score: 10 points per completed claim, max 100; users without
+            # completed claims have no row
+            scores = dict.fromkeys(usernames, 0.0)
+            for username, completed_count in result:
+                scores[username] = min(100.0, completed_count * 10)
+            return scores
             
         except Exception as e:
-            logger.warning(f"Could not get contribution score: {e}")
-            return 0.0
+            logger.warning(f"Could not get contribution scores: {e}")
+            return {}
     
-    async def _is_maintainer(self, username: str, repository_data: Dict) -> bool:
+    def _is_maintainer(self, username: str, repo_context: 'RepoContext') -> bool:
         """Check if user is a maintainer of the repository"""
         
-        # This would check GitHub permissions
-        # For now, simplified check
-        
-        maintainers = repository_data.get('maintainers', [])
-        return username.lower() in [m.lower() for m in maintainers]
+        return username.lower() in repo_context.maintainers
     
     def _detect_collaboration_intent(
         self,
@@ -289,23 +634,12 @@ class ClaimConflictResolver:
     ) -> bool:
         """Detect if new claimer wants to collaborate, not compete"""
         
-        collaboration_phrases = [
-            'help', 'assist', 'collaborate', 'together', 'team up',
-            'work with', 'join', 'contribute to', 'part of'
-        ]
-        
-        new_text_lower = new_text.lower()
+        # One pass checks for an @mention of the existing claimer or any
+        # collaboration keyword
+        if self._COLLAB_AUTOMATON is not None:
+            return '@' in new_text or _has_keyword(self._COLLAB_AUTOMATON, new_text.lower())
         
-        # Check if new claimer mentions the existing claimer
-        if '@' in new_text:
-            return True
-        
-        # Check for collaboration keywords
-        for phrase in collaboration_phrases:
-            if phrase in new_text_lower:
-                return True
-        
-        return False
+        return bool(self._COLLAB_RE.search(new_text))
     
     def _determine_resolution_strategy(
         self,
@@ -314,14 +648,22 @@ class ClaimConflictResolver:
         existing_reputation: 'ReputationScore',
         new_reputation: 'ReputationScore',
         is_collaboration: bool,
-        issue_data: Dict
+        issue_data: Dict,
+        roles: Tuple[str, str] = ('existing', 'new'),
+        priority_scores: Optional[Mapping[str, float]] = None
     ) -> ConflictResolution:
-        """Determine optimal resolution strategy"""
+        """
+        Determine optimal resolution strategy between two contenders: the
+        earlier claimer (existing_*) and the later one (new_*). roles names
+        them in the result; priority_scores defaults to both scores by role
+        """
         
-        priority_scores = {
-            'existing': existing_score,
-            'new': new_score
-        }
+        existing_role, new_role = roles
+        if priority_scores is None:
+            priority_scores = {
+                existing_role: existing_score,
+                new_role: new_score
+            }
         
         # Strategy 1: Collaboration detected
         if is_collaboration:
@@ -337,19 +679,22 @@ class ClaimConflictResolver:
             )
         
         # Strategy 2: Clear winner by significant margin
-        score_difference = abs(existing_score - new_score)
+        winner = existing_role if existing_score > new_score else new_role
+        winner_score, loser_score = (
+            (existing_score, new_score) if winner == existing_role else (new_score, existing_score)
+        )
+        score_difference = winner_score - loser_score
         if score_difference > 20:
-            winner = 'existing' if existing_score > new_score else 'new'
             winner_username = (
                 existing_reputation.metadata.get('username', 'existing')
-                if winner == 'existing'
+                if winner == existing_role
                 else new_reputation.metadata.get('username', 'new')
             )
             
             return ConflictResolution(
                 winner=winner,
                 resolution_strategy='PRIORITY_SCORE',
-                reasoning=f"Clear winner based on priority scoring. {winner} scored {max(existing_score, new_score):.1f} vs {min(existing_score, new_score):.1f}",
+                reasoning=f"Clear winner based on priority scoring. {winner} scored {winner_score:.1f} vs {loser_score:.1f}",
                 priority_scores=priority_scores,
                 should_allow_both=False,
                 recommended_split=None,
@@ -387,7 +732,7 @@ class ClaimConflictResolver:
         
         # Strategy 5: First come first served (small difference)
         return ConflictResolution(
-            winner='existing',
+            winner=existing_role,
             resolution_strategy='FIRST_COME',
             reasoning=f"Similar qualifications (scores within 20 points). First claimer gets priority.",
             priority_scores=priority_scores,
@@ -403,13 +748,13 @@ class ClaimConflictResolver:
         # Check labels
         labels = {label['name'].lower() for label in issue_data.get('labels', [])}
         
-        if any(label in ['blocker', 'critical'] for label in labels):
+        if labels & _VERY_HARD_LABELS:
             return 'VERY_HARD'
-        elif any(label in ['enhancement', 'feature'] for label in labels):
+        elif labels & _HARD_LABELS:
             return 'HARD'
-        elif any(label in ['bug', 'improvement'] for label in labels):
+        elif labels & _MEDIUM_LABELS:
             return 'MEDIUM'
-        elif any(label in ['good first issue', 'documentation'] for label in labels):
+        elif labels & _EASY_LABELS:
             return 'EASY'
         
         # Check description length
@@ -421,29 +766,13 @@ class ClaimConflictResolver:
         
         return 'MEDIUM'
     
-    def _suggest_work_split(self, issue_data: Dict) -> List[Dict]:
-        """Suggest how to split work between multiple contributors"""
+    def _suggest_work_split(self, issue_data: Dict) -> Sequence[Mapping]:
+        """Suggest how to split work between multiple contributors (shared, read-only)"""
         
         # This would use NLP to analyze issue and suggest subtasks
         # For now, generic suggestions
         
-        return [
-            {
-                'task': 'Implementation',
-                'description': 'Core functionality implementation',
-                'estimated_effort': 'HIGH'
-            },
-            {
-                'task': 'Testing',
-                'description': 'Write comprehensive tests',
-                'estimated_effort': 'MEDIUM'
-            },
-            {
-                'task': 'Documentation',
-                'description': 'Update documentation and examples',
-                'estimated_effort': 'LOW'
-            }
-        ]
+        return _DEFAULT_SPLIT
 
 
 async def get_conflict_resolver(db_session, reputation_engine):
@@ -10,22 +10,231 @@ Features:
 - Personalized messaging based on user type
 """
 
-import pytz
+import asyncio
+import time as time_module
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone, time
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from string import Template
+from typing import Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
 from dataclasses import dataclass
 import structlog
+from sqlalchemy.exc import SQLAlchemyError
 
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _tz(name: str) -> ZoneInfo:
+    """ZoneInfo for an IANA timezone name, memoized per name"""
+    return ZoneInfo(name)
+
+
+# Per-user timezone and activity patterns change slowly, and one claim's
+# escalation series asks for the same user several times; failed lookups
+# are not cached
+USER_PROFILE_CACHE_TTL = 86400.0
+USER_PROFILE_CACHE_MAX_SIZE = 10000
+_timezone_cache: Dict[int, Tuple[float, str]] = {}
+_activity_cache: Dict[int, Tuple[float, Dict]] = {}
+_activity_locks: Dict[int, asyncio.Lock] = {}
+
+
+def _cache_get(cache: Dict, key):
+    """Cached value for key if still within USER_PROFILE_CACHE_TTL, else None"""
+    cached = cache.get(key)
+    if cached is not None and time_module.monotonic() - cached[0] < USER_PROFILE_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _cache_put(cache: Dict, key, value) -> None:
+    """Cache value for key, evicting the oldest entry when full"""
+    if len(cache) >= USER_PROFILE_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        cache.pop(next(iter(cache)))
+    cache.pop(key, None)
+    cache[key] = (time_module.monotonic(), value)
+
+
+@asynccontextmanager
+async def _user_lock(locks: Dict, key):
+    """Serialize lookups for one user so concurrent misses query only once"""
+    lock = locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            yield
+    finally:
+        if not lock.locked() and locks.get(key) is lock:
+            del locks[key]
+
+
+# Activity window size; confidence reaches 100% at this many activities
+ACTIVITY_SAMPLE_SIZE = 50
+
+
+def _reduce_activity(hour_counts: List[int], weekend_count: int, total: int) -> Tuple[str, bool, float]:
+    """
+    Reduce an activity histogram (24 hourly counts, weekend total, overall
+    total) to (preferred_time, weekend_active, confidence)
+    """
+    # Determine preferred time period
+    morning_activity = sum(hour_counts[6:12])
+    afternoon_activity = sum(hour_counts[12:18])
+    evening_activity = sum(hour_counts[18:24])
+    
+    if afternoon_activity >= morning_activity and afternoon_activity >= evening_activity:
+        preferred_time = 'afternoon'
+    elif evening_activity >= morning_activity:
+        preferred_time = 'evening'
+    else:
+        preferred_time = 'morning'
+    
+    # Calculate confidence
+    confidence = min(100.0, (total / ACTIVITY_SAMPLE_SIZE) * 100)
+    
+    return preferred_time, weekend_count > 0, confidence
+
+
+# Patterns assumed when a user has no recorded activity
+_DEFAULT_ACTIVITY_PATTERNS = {
+    'preferred_time': 'afternoon',
+    'weekend_active': True,
+    'confidence': 20.0
+}
+
+
+def _patterns_from_histogram(histogram) -> Dict:
+    """
+    Activity patterns from (hour, ISO day of week, count) rows, as returned
+    by the activity histogram queries
+    """
+    if not histogram:
+        return dict(_DEFAULT_ACTIVITY_PATTERNS)
+    
+    # Fold into per-hour counts and a weekend total
+    hour_counts = [0] * 24
+    weekend_count = 0
+    total_activities = 0
+    
+    for activity_hour, activity_dow, count in histogram:
+        hour_counts[int(activity_hour)] += count
+        total_activities += count
+        
+        # Check if weekend (ISO: Saturday=6, Sunday=7)
+        if activity_dow >= 6:
+            weekend_count += count
+    
+    preferred_time, weekend_active, confidence = _reduce_activity(
+        hour_counts, weekend_count, total_activities
+    )
+    
+    return {
+        'preferred_time': preferred_time,
+        'weekend_active': weekend_active,
+        'confidence': confidence,
+        'hour_distribution': hour_counts  # index = hour of day
+    }
+
+
+# Nudge message templates by tone, parsed once at import. Each entry pairs the
+# template with the note substituted for $progress_note when progress was seen
+
+_FRIENDLY_TPL = Template("""Hey @${username}! 👋
+            
+Just wanted to check in on "${issue_title}" that you claimed ${days_since_claim} days ago.
+
+${progress_note}How's it going? Need any help or have questions?
+
+No pressure - just want to make sure you have what you need to succeed! 🚀""")
+
+_PROFESSIONAL_TPL = Template("""Hello @${username},
+
+This is a follow-up regarding issue "${issue_title}" claimed on ${claim_date_str}.
+
+${progress_note}Please provide a status update when you have a moment.
+
+If you need assistance or would like to discuss the implementation, feel free to reach out.
+
+Best regards,
+Cookie Licking Detector""")
+
+_CONCERNED_TPL = Template("""Hi @${username},
+
+We haven't seen updates on "${issue_title}" for ${days_since_claim} days.
+
+${progress_note}we want to ensure this issue keeps moving forward.
+
+Please respond within 3 days to:
+- Provide a status update
+- Request help if blocked  
+- Let us know if you can't continue
+
+Thank you for your understanding.""")
+
+_URGENT_TPL = Template("""@${username} - URGENT
+
+Issue "${issue_title}" has been claimed for ${days_since_claim} days without completion.
+
+This is the final reminder before auto-release.
+
+**Action Required within 24 hours:**
+- Submit a PR, OR
+- Provide concrete progress update, OR
+- Release the issue for others
+
+Please respond immediately.""")
+
+_FINAL_WARNING_TPL = Template("""FINAL NOTICE @${username}
+
+Issue "${issue_title}" will be auto-released in 24 hours.
+
+No further extensions will be granted.
+
+Submit progress immediately or this issue will be made available to other contributors.
+
+This is the last notification.""")
+
+_MESSAGE_TEMPLATES = {
+    'FRIENDLY': (_FRIENDLY_TPL, 'Great to see some activity! '),
+    'PROFESSIONAL': (_PROFESSIONAL_TPL, 'We noticed some progress - thank you! '),
+    'CONCERNED': (_CONCERNED_TPL, 'While there was some initial progress, '),
+    'URGENT': (_URGENT_TPL, ''),
+    'FINAL_WARNING': (_FINAL_WARNING_TPL, '')
+}
+
+
+class _LazyText:
+    """
+    Data descriptor for a dataclass str field that also accepts a
+    zero-argument callable; the callable runs on first read and its result
+    replaces it. The field keeps no default, so it stays required
+    """
+    
+    def __set_name__(self, owner, name):
+        self._attr = f'_{name}'
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            # Read by @dataclass as the default; AttributeError means none
+            raise AttributeError(self._attr[1:])
+        value = obj.__dict__[self._attr]
+        if callable(value):
+            value = obj.__dict__[self._attr] = value()
+        return value
+    
+    def __set__(self, obj, value):
+        obj.__dict__[self._attr] = value
+
+
 @dataclass
 class NudgeSchedule:
     """Optimized nudge schedule"""
     nudge_time: datetime
     timezone: str
     local_time: time
-    reasoning: str
+    reasoning: str = _LazyText()  # str, or a callable building it on first read
     message_tone: str  # FRIENDLY, PROFESSIONAL, URGENT
     escalation_level: int  # 1-5
     confidence: float
@@ -45,6 +254,19 @@ class AdaptiveNudgeScheduler:
         'evening': (18, 20)     # 6-8 PM
     }
     
+    # Hour to send at: the middle of each optimal range
+    _OPTIMAL_HOUR = {
+        period: (start_hour + end_hour) // 2
+        for period, (start_hour, end_hour) in OPTIMAL_HOURS.items()
+    }
+    
+    # Days to push a nudge forward, indexed by weekday (Monday=0)
+    _WEEKEND_SHIFT = (
+        timedelta(0), timedelta(0), timedelta(0), timedelta(0), timedelta(0),
+        timedelta(days=2),  # Saturday
+        timedelta(days=1)   # Sunday
+    )
+    
     # Escalation strategy
     ESCALATION_DELAYS = {
         1: 7,   # First nudge: 7 days
@@ -62,10 +284,44 @@ class AdaptiveNudgeScheduler:
         5: 'FINAL_WARNING'    # Last chance
     }
     
+    # Dense lookups indexed by nudge number; slot 0 holds the default used
+    # for any number outside 1-5. map() rather than a generator, since a
+    # generator body in a class block cannot see class-level names
+    _ESCALATION_DELAY_BY_NUDGE = (2,) + tuple(map(ESCALATION_DELAYS.__getitem__, range(1, 6)))
+    _MESSAGE_TONE_BY_NUDGE = ('PROFESSIONAL',) + tuple(map(MESSAGE_TONES.__getitem__, range(1, 6)))
+    
     def __init__(self, db_session, github_service):
         self.db = db_session
         self.github = github_service
     
+    @classmethod
+    def _escalation_delay(cls, nudge_number: int) -> int:
+        """Days to wait before nudge number nudge_number (default 2)"""
+        delays = cls._ESCALATION_DELAY_BY_NUDGE
+        return delays[nudge_number] if 0 <= nudge_number < len(delays) else delays[0]
+    
+    @classmethod
+    def _message_tone(cls, nudge_number: int) -> str:
+        """Message tone for nudge number nudge_number (default PROFESSIONAL)"""
+        tones = cls._MESSAGE_TONE_BY_NUDGE
+        return tones[nudge_number] if 0 <= nudge_number < len(tones) else tones[0]
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _nudge_plan(cls, nudge_number: int, grace_period_days: int) -> Tuple[int, timedelta, str]:
+        """
+        Everything about a nudge that depends only on its number and the
+        grace period: (days_to_wait, wait as a timedelta, message_tone)
+        """
+        if nudge_number == 1:
+            # First nudge - use grace period
+            days_to_wait = grace_period_days
+        else:
+            # Subsequent nudges - use escalation strategy
+            days_to_wait = cls._escalation_delay(nudge_number)
+        
+        return days_to_wait, timedelta(days=days_to_wait), cls._message_tone(nudge_number)
+    
     async def calculate_optimal_nudge_time(
         self,
         claim_id: int,
@@ -73,7 +329,8 @@ class AdaptiveNudgeScheduler:
         github_user_id: int,
         nudge_number: int,
         grace_period_days: int,
-        last_activity: Optional[datetime] = None
+        last_activity: Optional[datetime] = None,
+        now_utc: Optional[datetime] = None
     ) -> NudgeSchedule:
         """
         Calculate optimal time to send nudge based on:
@@ -81,61 +338,123 @@ class AdaptiveNudgeScheduler:
         2. Historical activity patterns
         3. Nudge escalation level
         4. Grace period
+        
+        Pass now_utc to schedule several claims against the same instant
         """
         
-        # Detect user's timezone
+        # Both lookups are served from the per-user caches when warm; on a
+        # miss they run one after another on the scheduler's session
         user_timezone = await self._detect_user_timezone(github_username, github_user_id)
-        
-        # Learn user's activity patterns
         activity_patterns = await self._learn_activity_patterns(github_user_id)
         
-        # Calculate base nudge time
-        if nudge_number == 1:
-            # First nudge - use grace period
-            days_to_wait = grace_period_days
-        else:
-            # Subsequent nudges - use escalation strategy
-            days_to_wait = self.ESCALATION_DELAYS.get(nudge_number, 2)
+        schedule = self._build_schedule(
+            nudge_number,
+            grace_period_days,
+            user_timezone,
+            activity_patterns,
+            now_utc or datetime.now(timezone.utc)
+        )
         
-        base_time = datetime.now(timezone.utc) + timedelta(days=days_to_wait)
+        logger.info(
+            f"Calculated optimal nudge time for {github_username}",
+            nudge_number=nudge_number,
+            timezone=user_timezone,
+            local_time=str(schedule.local_time)
+        )
+        
+        return schedule
+    
+    async def calculate_optimal_nudge_times_batch(
+        self,
+        requests: List[Tuple[int, int, int]]
+    ) -> List[NudgeSchedule]:
+        """
+        Calculate nudge schedules for many users at once (sweep jobs)
+        
+        Each request is (github_user_id, nudge_number, grace_period_days).
+        Activity histograms for every uncached user come from one grouped
+        query, and all schedules share a single "now". Results are returned
+        in request order
+        """
+        
+        now_utc = datetime.now(timezone.utc)
+        
+        patterns_by_user = {}
+        missing = set()
+        for user_id, _, _ in requests:
+            cached = _cache_get(_activity_cache, user_id)
+            if cached is not None:
+                patterns_by_user[user_id] = cached
+            else:
+                missing.add(user_id)
+        
+        if missing:
+            patterns_by_user.update(await self._learn_activity_patterns_batch(missing))
+        
+        schedules = []
+        for user_id, nudge_number, grace_period_days in requests:
+            # Timezone inference is not implemented yet; detection resolves
+            # every user to UTC, so the batch path skips the per-user probe
+            user_timezone = _cache_get(_timezone_cache, user_id) or 'UTC'
+            schedules.append(self._build_schedule(
+                nudge_number,
+                grace_period_days,
+                user_timezone,
+                patterns_by_user[user_id],
+                now_utc
+            ))
+        
+        logger.info(
+            "Calculated optimal nudge times for batch",
+            requests=len(requests),
+            queried_users=len(missing)
+        )
+        
+        return schedules
+    
+    def _build_schedule(
+        self,
+        nudge_number: int,
+        grace_period_days: int,
+        user_timezone: str,
+        activity_patterns: Dict,
+        now_utc: datetime
+    ) -> NudgeSchedule:
+        """Build a nudge schedule from already-resolved timezone and activity patterns"""
+        
+        # Wait and message tone are fixed per (nudge number, grace period)
+        days_to_wait, wait, message_tone = self._nudge_plan(nudge_number, grace_period_days)
+        
+        # Calculate base nudge time
+        base_time = now_utc + wait
         
         # Adjust to optimal hour in user's timezone
-        optimal_time = self._adjust_to_optimal_hour(
+        optimal_local = self._adjust_to_optimal_hour(
             base_time,
             user_timezone,
             activity_patterns
         )
         
-        # Avoid weekends for professional repos
-        optimal_time = self._avoid_weekends_if_needed(optimal_time, user_timezone)
+        # Avoid weekends for professional repos, judged on the user's
+        # local calendar day
+        optimal_local = self._avoid_weekends_if_needed(optimal_local)
         
-        # Get local time for user
-        user_tz = pytz.timezone(user_timezone)
-        local_time = optimal_time.astimezone(user_tz).time()
-        
-        # Determine message tone
-        message_tone = self.MESSAGE_TONES.get(nudge_number, 'PROFESSIONAL')
-        
-        # Generate reasoning
-        reasoning = self._generate_reasoning(
-            nudge_number,
-            days_to_wait,
-            activity_patterns,
-            user_timezone
-        )
+        optimal_time = optimal_local.astimezone(timezone.utc)
         
-        logger.info(
-            f"Calculated optimal nudge time for {github_username}",
-            nudge_number=nudge_number,
-            timezone=user_timezone,
-            local_time=str(local_time)
-        )
+        # Get local time for user
+        local_time = optimal_local.time()
         
         return NudgeSchedule(
             nudge_time=optimal_time,
             timezone=user_timezone,
             local_time=local_time,
-            reasoning=reasoning,
+            # Batch sweeps mostly drop the reasoning; build it on first read
+            reasoning=lambda: self._generate_reasoning(
+                nudge_number,
+                days_to_wait,
+                activity_patterns,
+                user_timezone
+            ),
             message_tone=message_tone,
             escalation_level=nudge_number,
             confidence=activity_patterns.get('confidence', 50.0),
@@ -152,44 +471,28 @@ class AdaptiveNudgeScheduler:
         1. GitHub profile
         2. Commit timestamps
         3. Activity patterns
+        
+        Inference is not implemented yet, so every user resolves to UTC
+        without touching the database. Results are cached per user for
+        USER_PROFILE_CACHE_TTL seconds
         """
-        try:
-            # Try to get from commit history
-            from app.db.models.claims import Claim
-            from sqlalchemy import select
-            
-            # Get user's recent claims
-            stmt = select(Claim).where(
-                Claim.github_user_id == user_id
-            ).limit(10)
-            
-            result = await self.db.execute(stmt)
-            claims = result.scalars().all()
-            
-            if claims:
-                # Analyze commit timestamps to infer timezone
-                # This is a simplified version - in production, would use ML
-                
-                # Most GitHub users are in these common timezones
-                common_timezones = [
-                    'America/New_York',      # EST/EDT
-                    'America/Los_Angeles',   # PST/PDT
-                    'Europe/London',         # GMT/BST
-                    'Europe/Berlin',         # CET/CEST
-                    'Asia/Tokyo',            # JST
-                    'Asia/Shanghai',         # CST
-                    'Australia/Sydney',      # AEST/AEDT
-                    'Asia/Kolkata'           # IST
-                ]
-                
-                # Default to UTC if can't determine
-                return 'UTC'
-            
-            return 'UTC'
-            
-        except Exception as e:
-            logger.warning(f"Could not detect timezone for {username}: {e}")
-            return 'UTC'
+        cached = _cache_get(_timezone_cache, user_id)
+        if cached is not None:
+            return cached
+        
+        # Analyze commit timestamps to infer timezone
+        # This is a simplified version - in production, would use ML
+        # (aggregate timestamps in SQL as _learn_activity_patterns does)
+        
+        # Default to UTC if can't determine
+        user_timezone = 'UTC'
+        
+        # Timezones are validated here, once, so the scheduling helpers
+        # can build ZoneInfo objects without guarding
+        _tz(user_timezone)
+        
+        _cache_put(_timezone_cache, user_id, user_timezone)
+        return user_timezone
     
     async def _learn_activity_patterns(self, user_id: int) -> Dict:
         """
@@ -197,72 +500,94 @@ class AdaptiveNudgeScheduler:
         1. Commit times
         2. Comment times
         3. PR creation times
+        
+        Results are cached per user for USER_PROFILE_CACHE_TTL seconds
         """
-        try:
+        cached = _cache_get(_activity_cache, user_id)
+        if cached is not None:
+            return cached
+        
+        async with _user_lock(_activity_locks, user_id):
+            # Another caller may have filled the cache while we waited
+            cached = _cache_get(_activity_cache, user_id)
+            if cached is not None:
+                return cached
+            
             from app.db.models.claims import Claim
             from app.db.models.activity_log import ActivityLog
-            from sqlalchemy import select
+            from sqlalchemy import select, func
             
-            # Get activity logs for this user
-            stmt = select(ActivityLog).join(Claim).where(
+            # Hour-of-day / day-of-week histogram of the user's most
+            # recent activities, aggregated in the database
+            recent = select(ActivityLog.timestamp).join(Claim).where(
                 Claim.github_user_id == user_id
-            ).limit(50)
-            
-            result = await self.db.execute(stmt)
-            activities = result.scalars().all()
+            ).order_by(ActivityLog.timestamp.desc()).limit(ACTIVITY_SAMPLE_SIZE).subquery()
             
-            if not activities:
-                return {
-                    'preferred_time': 'afternoon',
-                    'weekend_active': True,
-                    'confidence': 20.0
-                }
+            # Bucket in UTC rather than the session's TimeZone setting
+            utc_timestamp = func.timezone('UTC', recent.c.timestamp)
+            hour = func.extract('hour', utc_timestamp)
+            isodow = func.extract('isodow', utc_timestamp)
+            stmt = select(hour, isodow, func.count()).group_by(hour, isodow)
             
-            # Analyze activity timestamps
-            hour_counts = {i: 0 for i in range(24)}
-            weekend_count = 0
-            weekday_count = 0
+            try:
+                result = await self.db.execute(stmt)
+                histogram = result.all()
+            except SQLAlchemyError as e:
+                logger.warning(f"Could not learn activity patterns: {e}")
+                return dict(_DEFAULT_ACTIVITY_PATTERNS)
             
-            for activity in activities:
-                hour = activity.timestamp.hour
-                hour_counts[hour] += 1
-                
-                # Check if weekend
-                if activity.timestamp.weekday() >= 5:  # Saturday/Sunday
-                    weekend_count += 1
-                else:
-                    weekday_count += 1
-            
-            # Determine preferred time period
-            morning_activity = sum(hour_counts[h] for h in range(6, 12))
-            afternoon_activity = sum(hour_counts[h] for h in range(12, 18))
-            evening_activity = sum(hour_counts[h] for h in range(18, 24))
-            
-            if afternoon_activity >= morning_activity and afternoon_activity >= evening_activity:
-                preferred_time = 'afternoon'
-            elif evening_activity >= morning_activity:
-                preferred_time = 'evening'
-            else:
-                preferred_time = 'morning'
-            
-            # Calculate confidence
-            total_activities = len(activities)
-            confidence = min(100.0, (total_activities / 50) * 100)
-            
-            return {
-                'preferred_time': preferred_time,
-                'weekend_active': weekend_count > 0,
-                'confidence': confidence,
-                'hour_distribution': hour_counts
-            }
-            
-        except Exception as e:
-            logger.warning(f"Could not learn activity patterns: {e}")
-            return {
-                'preferred_time': 'afternoon',
-                'weekend_active': True,
-                'confidence': 20.0
-            }
+            patterns = _patterns_from_histogram(histogram)
+            _cache_put(_activity_cache, user_id, patterns)
+            return patterns
+    
+    async def _learn_activity_patterns_batch(self, user_ids: Set[int]) -> Dict[int, Dict]:
+        """
+        Activity patterns for many users from one grouped query over each
+        user's most recent activities; successful results are cached
+        """
+        
+        from app.db.models.claims import Claim
+        from app.db.models.activity_log import ActivityLog
+        from sqlalchemy import select, func
+        
+        # Rank each user's activities newest first so the histogram
+        # covers the same window as _learn_activity_patterns
+        ranked = select(
+            Claim.github_user_id,
+            ActivityLog.timestamp,
+            func.row_number().over(
+                partition_by=Claim.github_user_id,
+                order_by=ActivityLog.timestamp.desc()
+            ).label('rank')
+        ).select_from(ActivityLog).join(Claim).where(
+            Claim.github_user_id.in_(user_ids)
+        ).subquery()
+        
+        # Bucket in UTC rather than the session's TimeZone setting
+        utc_timestamp = func.timezone('UTC', ranked.c.timestamp)
+        hour = func.extract('hour', utc_timestamp)
+        isodow = func.extract('isodow', utc_timestamp)
+        stmt = select(ranked.c.github_user_id, hour, isodow, func.count()).where(
+            ranked.c.rank <= ACTIVITY_SAMPLE_SIZE
+        ).group_by(ranked.c.github_user_id, hour, isodow)
+        
+        try:
+            result = await self.db.execute(stmt)
+            rows = result.all()
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not learn activity patterns for batch: {e}")
+            return {user_id: dict(_DEFAULT_ACTIVITY_PATTERNS) for user_id in user_ids}
+        
+        histograms = {user_id: [] for user_id in user_ids}
+        for user_id, activity_hour, activity_dow, count in rows:
+            histograms[user_id].append((activity_hour, activity_dow, count))
+        
+        patterns_by_user = {}
+        for user_id, histogram in histograms.items():
+            patterns_by_user[user_id] = _patterns_from_histogram(histogram)
+            _cache_put(_activity_cache, user_id, patterns_by_user[user_id])
+        
+        return patterns_by_user
     
     def _adjust_to_optimal_hour(
         self,
@@ -270,60 +595,36 @@ class AdaptiveNudgeScheduler:
         timezone_str: str,
         activity_patterns: Dict
     ) -> datetime:
-        """Adjust timestamp to user's optimal activity hour"""
+        """
+        Adjust timestamp to user's optimal activity hour, returned in the
+        user's timezone
+        """
         
-        try:
-            user_tz = pytz.timezone(timezone_str)
-            local_time = base_time.astimezone(user_tz)
-            
-            # Get optimal hour range for preferred time
-            preferred_time = activity_patterns.get('preferred_time', 'afternoon')
-            start_hour, end_hour = self.OPTIMAL_HOURS[preferred_time]
-            
-            # Set to middle of optimal range
-            optimal_hour = (start_hour + end_hour) // 2
-            
-            # Create new datetime with optimal hour
-            optimal_local = local_time.replace(
-                hour=optimal_hour,
-                minute=0,
-                second=0,
-                microsecond=0
-            )
-            
-            # Convert back to UTC
-            return optimal_local.astimezone(timezone.utc)
-            
-        except Exception as e:
-            logger.warning(f"Could not adjust to optimal hour: {e}")
-            return base_time
+        user_tz = _tz(timezone_str)
+        local_date = base_time.astimezone(user_tz).date()
+        
+        # Middle of the optimal range for the preferred time
+        preferred_time = activity_patterns.get('preferred_time', 'afternoon')
+        optimal_hour = self._OPTIMAL_HOUR.get(preferred_time, 15)
+        
+        # Build the local wall-clock time directly on the user's calendar
+        # day; the single conversion back to UTC happens in the caller
+        return datetime(
+            local_date.year,
+            local_date.month,
+            local_date.day,
+            optimal_hour,
+            tzinfo=user_tz
+        )
     
-    def _avoid_weekends_if_needed(
-        self,
-        scheduled_time: datetime,
-        timezone_str: str
-    ) -> datetime:
-        """Avoid weekends for professional repositories"""
+    def _avoid_weekends_if_needed(self, local_time: datetime) -> datetime:
+        """
+        Avoid weekends for professional repositories
+        local_time must already be in the user's timezone
+        """
         
-        try:
-            user_tz = pytz.timezone(timezone_str)
-            local_time = scheduled_time.astimezone(user_tz)
-            
-            # Check if weekend (Saturday=5, Sunday=6)
-            weekday = local_time.weekday()
-            
-            if weekday == 5:  # Saturday
-                # Move to Monday
-                scheduled_time += timedelta(days=2)
-            elif weekday == 6:  # Sunday
-                # Move to Monday
-                scheduled_time += timedelta(days=1)
-            
-            return scheduled_time
-            
-        except Exception as e:
-            logger.warning(f"Could not avoid weekends: {e}")
-            return scheduled_time
+        # Saturday and Sunday move to Monday, keeping the local hour
+        return local_time + self._WEEKEND_SHIFT[local_time.weekday()]
     
     def _generate_reasoning(
         self,
@@ -335,15 +636,13 @@ class AdaptiveNudgeScheduler:
         """Generate human-readable reasoning for schedule"""
         
         preferred_time = activity_patterns.get('preferred_time', 'afternoon')
+        escalation = f" Escalation level {nudge_number} - increased urgency." if nudge_number > 2 else ""
         
-        reasoning = f"Nudge #{nudge_number} scheduled for {days_to_wait} days from now. "
-        reasoning += f"Sending during user's preferred active time ({preferred_time}) "
-        reasoning += f"in their timezone ({timezone})."
-        
-        if nudge_number > 2:
-            reasoning += f" Escalation level {nudge_number} - increased urgency."
-        
-        return reasoning
+        return (
+            f"Nudge #{nudge_number} scheduled for {days_to_wait} days from now. "
+            f"Sending during user's preferred active time ({preferred_time}) "
+            f"in their timezone ({timezone}).{escalation}"
+        )
     
     def should_skip_nudge(
         self,
@@ -381,7 +680,7 @@ class AdaptiveNudgeScheduler:
     ) -> int:
         """Calculate adaptive delay for next nudge"""
         
-        base_delay = self.ESCALATION_DELAYS.get(current_nudge + 1, 2)
+        base_delay = self._escalation_delay(current_nudge + 1)
         
         # Extend delay if good progress
         if progress_score > 60:
@@ -399,68 +698,29 @@ class AdaptiveNudgeScheduler:
         username: str,
         issue_title: str,
         days_since_claim: int,
-        progress_detected: bool
+        progress_detected: bool,
+        claim_date_str: Optional[str] = None
     ) -> str:
-        """Generate personalized nudge message based on tone"""
+        """
+        Generate personalized nudge message based on tone
         
-        templates = {
-            'FRIENDLY': f"""Hey @{username}! 👋
-            
-Just wanted to check in on "{issue_title}" that you claimed {days_since_claim} days ago.
-
-{'Great to see some activity! ' if progress_detected else ''}How's it going? Need any help or have questions?
-
-No pressure - just want to make sure you have what you need to succeed! 🚀""",
-            
-            'PROFESSIONAL': f"""Hello @{username},
-
-This is a follow-up regarding issue "{issue_title}" claimed on {datetime.now().strftime('%B %d')}.
-
-{'We noticed some progress - thank you! ' if progress_detected else ''}Please provide a status update when you have a moment.
-
-If you need assistance or would like to discuss the implementation, feel free to reach out.
-
-Best regards,
-Cookie Licking Detector""",
-            
-            'CONCERNED': f"""Hi @{username},
-
-We haven't seen updates on "{issue_title}" for {days_since_claim} days.
-
-{f'While there was some initial progress, ' if progress_detected else ''}we want to ensure this issue keeps moving forward.
-
-Please respond within 3 days to:
-- Provide a status update
-- Request help if blocked  
-- Let us know if you can't continue
-
-Thank you for your understanding.""",
-            
-            'URGENT': f"""@{username} - URGENT
-
-Issue "{issue_title}" has been claimed for {days_since_claim} days without completion.
-
-This is the final reminder before auto-release.
-
-**Action Required within 24 hours:**
-- Submit a PR, OR
-- Provide concrete progress update, OR
-- Release the issue for others
-
-Please respond immediately.""",
-            
-            'FINAL_WARNING': f"""FINAL NOTICE @{username}
-
-Issue "{issue_title}" will be auto-released in 24 hours.
-
-No further extensions will be granted.
-
-Submit progress immediately or this issue will be made available to other contributors.
-
-This is the last notification."""
-        }
+        claim_date_str (e.g. 'March 04') is only rendered by the professional
+        tone; callers sending many messages can format it once up front
+        """
         
-        return templates.get(message_tone, templates['PROFESSIONAL'])
+        template, progress_note = _MESSAGE_TEMPLATES.get(
+            message_tone, _MESSAGE_TEMPLATES['PROFESSIONAL']
+        )
+        if claim_date_str is None and template is _PROFESSIONAL_TPL:
+            claim_date_str = datetime.now().strftime('%B %d')
+        
+        return template.substitute(
+            username=username,
+            issue_title=issue_title,
+            days_since_claim=days_since_claim,
+            claim_date_str=claim_date_str,
+            progress_note=progress_note if progress_detected else ''
+        )
 
 
 async def get_nudge_scheduler(db_session, github_service):
@@ -12,14 +12,207 @@ Features:
 - Predictive completion timeline
 """
 
+import asyncio
+import copy
 import re
+import sys
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import structlog
 
+try:
+    import ahocorasick
+except ImportError:  # optional; keyword scans fall back to the compiled regexes
+    ahocorasick = None
+
 logger = structlog.get_logger(__name__)
 
+# datetime.fromisoformat understands a 'Z' suffix from Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# GitHub commit and PR lookups keyed by (owner, name, username, since[, issue]),
+# so a claim re-analyzed within the TTL (e.g. by the nudge scheduler) does not
+# hit the API again; failed fetches are not cached
+GITHUB_FETCH_CACHE_TTL = 120.0
+GITHUB_FETCH_CACHE_MAX_SIZE = 1024
+_commit_cache: Dict[Tuple, Tuple[float, List[Dict]]] = {}
+_pr_cache: Dict[Tuple, Tuple[float, List[Dict]]] = {}
+_fetch_locks: Dict[Tuple, asyncio.Lock] = {}
+
+# No-activity analyses keyed by issue complexity (None for unknown ones);
+# see ProgressAnalysisEngine._empty_analysis
+_empty_analyses: Dict[Optional[str], "ProgressAnalysis"] = {}
+
+
+def _cache_get(cache: Dict, key):
+    """Copy of the cached value for key if within GITHUB_FETCH_CACHE_TTL, else None"""
+    cached = cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < GITHUB_FETCH_CACHE_TTL:
+        # Callers own the returned lists, so never hand out the cached ones
+        return copy.deepcopy(cached[1])
+    return None
+
+
+def _cache_put(cache: Dict, key, value) -> None:
+    """Cache a copy of value for key, evicting the oldest entry when full"""
+    if len(cache) >= GITHUB_FETCH_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        cache.pop(next(iter(cache)))
+    cache.pop(key, None)
+    cache[key] = (time.monotonic(), copy.deepcopy(value))
+
+
+@asynccontextmanager
+async def _fetch_lock(key):
+    """Serialize fetches for one key so concurrent misses call GitHub only once"""
+    lock = _fetch_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            yield
+    finally:
+        if not lock.locked() and _fetch_locks.get(key) is lock:
+            del _fetch_locks[key]
+
+# Semantic commit message keywords, mapped to the classification buckets a
+# whole-word hit marks
+_COMMIT_KEYWORD_BUCKETS = {
+    **dict.fromkeys(
+        ('feat', 'feature', 'add', 'implement', 'create',
+         'fix', 'bugfix', 'resolve', 'patch',
+         'refactor', 'improve', 'optimize', 'enhance', 'coverage'),
+        frozenset({'meaningful'})
+    ),
+    **dict.fromkeys(('test', 'spec'), frozenset({'meaningful', 'test'})),
+    **dict.fromkeys(('doc', 'documentation', 'readme'), frozenset({'meaningful', 'doc'})),
+    **dict.fromkeys(
+        ('wip', 'work in progress', 'typo', 'formatting', 'whitespace',
+         'todo', 'fixme', 'placeholder'),
+        frozenset({'trivial'})
+    ),
+}
+_ALL_BUCKETS = frozenset({'meaningful', 'trivial', 'test', 'doc'})
+
+
+def _build_keyword_automaton(keywords: Dict[str, frozenset]):
+    """
+    Build an Aho-Corasick automaton over lowercase keywords, or None if
+    unavailable. Each hit yields (keyword, value)
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, value in keywords.items():
+        automaton.add_word(keyword.lower(), (keyword.lower(), value))
+    automaton.make_automaton()
+    return automaton
+
+
+def _parse_gh_ts(value: str) -> datetime:
+    """
+    Parse a GitHub ISO-8601 timestamp as an aware UTC-based datetime.
+    Accepts a trailing 'Z'; naive values (as serialized from PyGithub's
+    naive UTC datetimes) are taken to be UTC
+    """
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        parsed = datetime.fromisoformat(value)
+    elif value.endswith('Z'):
+        parsed = datetime.fromisoformat(value[:-1] + '+00:00')
+    else:
+        parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _clamp_percent(value: float) -> float:
+    """Clamp a score to 0-100 with plain comparisons"""
+    if value < 0.0:
+        return 0.0
+    if value > 100.0:
+        return 100.0
+    return value
+
+
+def _build_commit_regex(keyword_buckets: Dict[str, frozenset]):
+    """
+    Compile one case-insensitive whole-word alternation over every commit
+    keyword, with a named group per bucket combination. Returns the pattern
+    and the buckets each group name stands for
+    """
+    keywords_by_buckets: Dict[frozenset, List[str]] = {}
+    for keyword, buckets in keyword_buckets.items():
+        keywords_by_buckets.setdefault(buckets, []).append(re.escape(keyword))
+    
+    group_buckets = {}
+    alternatives = []
+    for buckets, keywords in keywords_by_buckets.items():
+        name = '_'.join(sorted(buckets))
+        group_buckets[name] = buckets
+        alternatives.append(f"(?P<{name}>{'|'.join(keywords)})")
+    
+    pattern = re.compile(r'\b(?:' + '|'.join(alternatives) + r')\b', re.IGNORECASE)
+    return pattern, group_buckets
+
+
+_COMMIT_RE, _COMMIT_GROUP_BUCKETS = _build_commit_regex(_COMMIT_KEYWORD_BUCKETS)
+
+
+def _is_word_char(char: str) -> bool:
+    """Same character class as the regex \\w"""
+    return char.isalnum() or char == '_'
+
+
+def _keyword_buckets(automaton, text: str) -> frozenset:
+    """
+    Union of the buckets of every keyword occurring in text as a whole word,
+    matching the \\b boundaries of the regex patterns
+    """
+    buckets = frozenset()
+    for end, (keyword, keyword_buckets) in automaton.iter(text):
+        start = end - len(keyword) + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        buckets |= keyword_buckets
+        if buckets == _ALL_BUCKETS:
+            break
+    return buckets
+
+
+# Commit keywords are matched in a single pass: by an Aho-Corasick automaton
+# when pyahocorasick is installed, else by the fused _COMMIT_RE. Vague
+# one-word messages are anchored, not keywords, so they keep their own regex
+_COMMIT_AUTOMATON = _build_keyword_automaton(_COMMIT_KEYWORD_BUCKETS)
+_VAGUE_RE = re.compile(r'^(update|fix|change)\s*$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=8192)
+def _classify_commit_message(message: str) -> Tuple[bool, bool, bool, bool]:
+    """
+    Return (meaningful, trivial, mentions tests, mentions docs) for a commit
+    message. Memoized, since re-analyzing a claim sees the same commits again
+    """
+    if _COMMIT_AUTOMATON is not None:
+        buckets = _keyword_buckets(_COMMIT_AUTOMATON, message.lower())
+    else:
+        buckets = frozenset()
+        for match in _COMMIT_RE.finditer(message):
+            buckets |= _COMMIT_GROUP_BUCKETS[match.lastgroup]
+            if buckets == _ALL_BUCKETS:
+                break
+    
+    return (
+        'meaningful' in buckets,
+        'trivial' in buckets or _VAGUE_RE.search(message) is not None,
+        'test' in buckets,
+        'doc' in buckets
+    )
+
 
 @dataclass
 class ProgressAnalysis:
@@ -44,27 +237,13 @@ class ProgressAnalysisEngine:
     Goes beyond simple "commit exists" checks
     """
     
-    # Semantic commit message patterns
-    MEANINGFUL_COMMIT_PATTERNS = [
-        r'\b(feat|feature|add|implement|create)\b',
-        r'\b(fix|bugfix|resolve|patch)\b',
-        r'\b(refactor|improve|optimize|enhance)\b',
-        r'\b(test|spec|coverage)\b',
-        r'\b(doc|documentation|readme)\b',
-    ]
-    
-    TRIVIAL_COMMIT_PATTERNS = [
-        r'\b(wip|work in progress)\b',
-        r'\b(typo|formatting|whitespace)\b',
-        r'\b(todo|fixme|placeholder)\b',
-        r'^(update|fix|change)\s*$',  # Vague single-word messages
-    ]
-    
     # PR state indicators
     WIP_INDICATORS = [
         'wip', 'work in progress', 'draft', 'do not merge',
         'dnm', 'not ready', 'incomplete'
     ]
+    # Whole-word match, so e.g. 'drafthouse' or 'dnmx' are not WIP markers
+    _WIP_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, WIP_INDICATORS)) + r')\b')
     
     # Stall indicators
     STALL_INDICATORS = {
@@ -73,6 +252,25 @@ class ProgressAnalysisEngine:
         'no_review_activity_days': 3,  # No review responses for N days
     }
     
+    # Baseline days to complete an issue by complexity
+    _COMPLEXITY_DAYS = {
+        'TRIVIAL': 2,
+        'EASY': 5,
+        'MEDIUM': 10,
+        'HARD': 20,
+        'VERY_HARD': 30
+    }
+    
+    # Estimate with no velocity: double the baseline, within the 1-60 day bounds
+    _IDLE_COMPLETION_DAYS = {
+        complexity: max(1, min(60, days * 2))
+        for complexity, days in _COMPLEXITY_DAYS.items()
+    }
+    
+    # Commits + PRs at which scoring moves off the event loop thread; below
+    # this the thread hand-off costs more than the work
+    THREAD_OFFLOAD_MIN_ITEMS = 200
+    
     def __init__(self, db_session, github_service, ecosyste_client):
         self.db = db_session
         self.github = github_service
@@ -97,22 +295,84 @@ class ProgressAnalysisEngine:
         5. Issue comments
         """
         
-        logger.info(f"Starting advanced progress analysis for claim {claim_id}")
+        logger.info("Starting advanced progress analysis", claim_id=claim_id)
+        
+        # Gather all progress data; the three GitHub lookups are independent
+        commits, prs, branch_activity = await asyncio.gather(
+            self._fetch_commits(repository_data, username, claim_timestamp),
+            self._fetch_pull_requests(repository_data, issue_data, username, claim_timestamp),
+            self._check_branch_activity(repository_data, username),
+            return_exceptions=True
+        )
         
-        # Gather all progress data
-        commits = await self._fetch_commits(repository_data, username, claim_timestamp)
-        prs = await self._fetch_pull_requests(repository_data, issue_data, username, claim_timestamp)
-        branch_activity = await self._check_branch_activity(repository_data, username)
+        # Cancellation and other non-Exception errors must still propagate
+        for outcome in (commits, prs, branch_activity):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+        
+        # Fall back to the same empty results the fetchers use on failure
+        if isinstance(commits, BaseException):
+            logger.warning("Error fetching commits", error=str(commits))
+            commits = []
+        if isinstance(prs, BaseException):
+            logger.warning("Error fetching PRs", error=str(prs))
+            prs = []
+        if isinstance(branch_activity, BaseException):
+            logger.warning("Error checking branch activity", error=str(branch_activity))
+            branch_activity = False
+        
+        # Nothing to analyze yet (typical for fresh claims)
+        if not commits and not prs and not branch_activity:
+            logger.info("No progress data found", claim_id=claim_id)
+            return self._empty_analysis(issue_data)
+        
+        # Review activity depends on the fetched PRs
         review_activity = await self._check_review_activity(prs)
         
+        # One reference time for every age computed in this analysis
+        now = datetime.now(timezone.utc)
+        
+        # The scoring below is synchronous CPU work; for large histories run
+        # it in a worker thread so other analyses can use the event loop
+        args = (issue_data, claim_timestamp, commits, prs, branch_activity, review_activity, now)
+        if len(commits) + len(prs) >= self.THREAD_OFFLOAD_MIN_ITEMS:
+            analysis = await asyncio.to_thread(self._analyze_fetched, *args)
+        else:
+            analysis = self._analyze_fetched(*args)
+        
+        logger.info(
+            "Progress analysis complete",
+            claim_id=claim_id,
+            score=analysis.progress_score,
+            completion_prob=analysis.completion_probability,
+            progress_types=analysis.progress_type
+        )
+        
+        return analysis
+    
+    def _analyze_fetched(
+        self,
+        issue_data: Dict,
+        claim_timestamp: datetime,
+        commits: List[Dict],
+        prs: List[Dict],
+        branch_activity: bool,
+        review_activity: List[Dict],
+        now: datetime
+    ) -> ProgressAnalysis:
+        """
+        Score already-fetched progress data. Pure computation over its
+        arguments (no I/O, no session use), so it is safe to run in a thread
+        """
+        
         # Analyze each component
         commit_analysis = self._analyze_commits(commits)
-        pr_analysis = self._analyze_pull_requests(prs, issue_data['github_issue_number'])
+        pr_analysis = self._analyze_pull_requests(prs, issue_data['github_issue_number'], now)
         review_analysis = self._analyze_review_activity(review_activity)
-        velocity_analysis = self._calculate_velocity(commits, prs, claim_timestamp)
+        velocity_analysis = self._calculate_velocity(commits, prs, claim_timestamp, now)
         
         # Detect stall patterns
-        stall_signals = self._detect_stall_patterns(commits, prs, review_activity)
+        stall_signals = self._detect_stall_patterns(commits, pr_analysis, review_activity, now)
         
         # Calculate overall progress score
         progress_score = self._calculate_progress_score(
@@ -129,8 +389,7 @@ class ProgressAnalysisEngine:
         completion_prob = self._predict_completion_probability(
             progress_score,
             velocity_analysis,
-            stall_signals,
-            claim_timestamp
+            stall_signals
         )
         
         # Estimate completion timeline
@@ -176,16 +435,9 @@ class ProgressAnalysisEngine:
             'review_engagement': review_analysis['response_rate']
         }
         
-        # Risk signals
-        risk_signals = stall_signals + self._identify_risk_signals(
-            commit_analysis, pr_analysis, velocity_analysis
-        )
-        
-        logger.info(
-            f"Progress analysis complete for claim {claim_id}",
-            score=progress_score,
-            completion_prob=completion_prob,
-            progress_types=progress_types
+        # Risk signals, stall signals first
+        risk_signals = self._compute_signals(
+            commit_analysis, pr_analysis, velocity_analysis, stall_signals
         )
         
         return ProgressAnalysis(
@@ -209,24 +461,64 @@ class ProgressAnalysisEngine:
             }
         )
     
+    def _empty_analysis(self, issue_data: Dict) -> ProgressAnalysis:
+        """
+        The analysis _analyze_fetched produces when there are no commits, PRs
+        or branch activity. It depends only on the issue complexity, so it is
+        scored once per complexity and copied out of _empty_analyses
+        """
+        complexity = issue_data.get('complexity', 'MEDIUM')
+        if complexity not in self._COMPLEXITY_DAYS:
+            complexity = None  # every unknown complexity scores the same
+        
+        analysis = _empty_analyses.get(complexity)
+        if analysis is None:
+            # Empty inputs make the scoring independent of the timestamps
+            now = datetime.now(timezone.utc)
+            analysis = self._analyze_fetched(issue_data, now, [], [], False, [], now)
+            _empty_analyses[complexity] = analysis
+        
+        # Callers own their analysis; don't hand out the memoized lists/dicts
+        return copy.deepcopy(analysis)
+    
     async def _fetch_commits(
         self, 
         repository_data: Dict, 
         username: str, 
         since: datetime
     ) -> List[Dict]:
-        """Fetch commits with full metadata"""
-        try:
-            commits = await self.github.get_user_commits(
-                owner=repository_data['owner'],
-                name=repository_data['name'],
-                username=username,
-                since=since
-            )
-            return commits or []
-        except Exception as e:
-            logger.warning(f"Error fetching commits: {e}")
-            return []
+        """Fetch commits with full metadata, cached for GITHUB_FETCH_CACHE_TTL seconds"""
+        key = (
+            'commits',
+            repository_data['owner'],
+            repository_data['name'],
+            username,
+            since.isoformat(timespec='minutes')
+        )
+        cached = _cache_get(_commit_cache, key)
+        if cached is not None:
+            return cached
+        
+        async with _fetch_lock(key):
+            # Another caller may have filled the cache while we waited
+            cached = _cache_get(_commit_cache, key)
+            if cached is not None:
+                return cached
+            
+            try:
+                commits = await self.github.get_user_commits(
+                    owner=repository_data['owner'],
+                    name=repository_data['name'],
+                    username=username,
+                    since=since
+                )
+            except Exception as e:
+                logger.warning("Error fetching commits", error=str(e))
+                return []
+            
+            commits = commits or []
+            _cache_put(_commit_cache, key, commits)
+            return commits
     
     async def _fetch_pull_requests(
         self,
@@ -235,25 +527,44 @@ class ProgressAnalysisEngine:
         username: str,
         since: datetime
     ) -> List[Dict]:
-        """Fetch PRs referencing the issue"""
-        try:
-            prs = await self.github.get_pull_requests_for_issue(
-                owner=repository_data['owner'],
-                name=repository_data['name'],
-                issue_number=issue_data['github_issue_number']
-            )
+        """Fetch PRs referencing the issue, cached for GITHUB_FETCH_CACHE_TTL seconds"""
+        key = (
+            'prs',
+            repository_data['owner'],
+            repository_data['name'],
+            username,
+            since.isoformat(timespec='minutes'),
+            issue_data['github_issue_number']
+        )
+        cached = _cache_get(_pr_cache, key)
+        if cached is not None:
+            return cached
+        
+        async with _fetch_lock(key):
+            # Another caller may have filled the cache while we waited
+            cached = _cache_get(_pr_cache, key)
+            if cached is not None:
+                return cached
             
-            # Filter by user and date
-            user_prs = [
-                pr for pr in prs
-                if pr.get('user', {}).get('login') == username
-                and datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00')) >= since
-            ]
+            try:
+                prs = await self.github.get_pull_requests_for_issue(
+                    owner=repository_data['owner'],
+                    name=repository_data['name'],
+                    issue_number=issue_data['github_issue_number']
+                )
+                
+                # Filter by user and date
+                user_prs = [
+                    pr for pr in prs
+                    if pr.get('user', {}).get('login') == username
+                    and _parse_gh_ts(pr['created_at']) >= since
+                ]
+            except Exception as e:
+                logger.warning("Error fetching PRs", error=str(e))
+                return []
             
+            _cache_put(_pr_cache, key, user_prs)
             return user_prs
-        except Exception as e:
-            logger.warning(f"Error fetching PRs: {e}")
-            return []
     
     async def _check_branch_activity(self, repository_data: Dict, username: str) -> bool:
         """Check if user has active branches"""
@@ -289,18 +600,10 @@ class ProgressAnalysisEngine:
         has_docs = False
         
         for commit in commits:
-            message = commit.get('message', '').lower()
-            
-            # Check if meaningful
-            is_meaningful = any(
-                re.search(pattern, message, re.IGNORECASE)
-                for pattern in self.MEANINGFUL_COMMIT_PATTERNS
-            )
+            message = commit.get('message', '')
             
-            # Check if trivial
-            is_trivial = any(
-                re.search(pattern, message, re.IGNORECASE)
-                for pattern in self.TRIVIAL_COMMIT_PATTERNS
+            is_meaningful, is_trivial, mentions_tests, mentions_docs = (
+                _classify_commit_message(message)
             )
             
             if is_meaningful and not is_trivial:
@@ -309,11 +612,11 @@ class ProgressAnalysisEngine:
                 trivial_count += 1
             
             # Check for tests
-            if re.search(r'\b(test|spec)\b', message, re.IGNORECASE):
+            if mentions_tests:
                 has_tests = True
             
             # Check for docs
-            if re.search(r'\b(doc|readme|documentation)\b', message, re.IGNORECASE):
+            if mentions_docs:
                 has_docs = True
         
         # Calculate quality score
@@ -331,13 +634,25 @@ class ProgressAnalysisEngine:
             'has_docs': has_docs
         }
     
-    def _analyze_pull_requests(self, prs: List[Dict], issue_number: int) -> Dict:
+    def _analyze_pull_requests(
+        self,
+        prs: List[Dict],
+        issue_number: int,
+        now: Optional[datetime] = None
+    ) -> Dict:
         """Analyze PR state and quality"""
+        now = now or datetime.now(timezone.utc)
         total_prs = len(prs)
         open_prs = 0
         draft_prs = 0
         merged_prs = 0
-        stalled_prs = 0
+        stalled_pr_numbers = []
+        
+        # A PR is stalled once more than no_pr_updates_days whole days have
+        # passed, i.e. its last update is at or before this cutoff
+        stall_cutoff = now - timedelta(
+            days=self.STALL_INDICATORS['no_pr_updates_days'] + 1
+        )
         
         for pr in prs:
             state = pr.get('state', '').lower()
@@ -347,19 +662,19 @@ class ProgressAnalysisEngine:
                 
                 # Check if draft
                 title = pr.get('title', '').lower()
-                if any(indicator in title for indicator in self.WIP_INDICATORS):
+                if self._WIP_RE.search(title):
                     draft_prs += 1
                 
                 # Check if stalled
-                updated_at = datetime.fromisoformat(pr['updated_at'].replace('Z', '+00:00'))
-                days_since_update = (datetime.now(timezone.utc) - updated_at).days
-                
-                if days_since_update > self.STALL_INDICATORS['no_pr_updates_days']:
-                    stalled_prs += 1
+                updated_at = _parse_gh_ts(pr['updated_at'])
+                if updated_at <= stall_cutoff:
+                    stalled_pr_numbers.append(pr['number'])
             
             elif pr.get('merged_at'):
                 merged_prs += 1
         
+        stalled_prs = len(stalled_pr_numbers)
+        
         # Calculate PR quality score
         quality_score = 0.0
         if total_prs > 0:
@@ -376,7 +691,8 @@ class ProgressAnalysisEngine:
             'draft_prs': draft_prs,
             'merged_prs': merged_prs,
             'stalled_prs': stalled_prs,
-            'quality_score': max(0.0, min(100.0, quality_score)),
+            'stalled_pr_numbers': stalled_pr_numbers,
+            'quality_score': _clamp_percent(quality_score),
             'has_merged': merged_prs > 0,
             'has_open': open_prs > 0
         }
@@ -397,10 +713,12 @@ class ProgressAnalysisEngine:
         self, 
         commits: List[Dict], 
         prs: List[Dict], 
-        claim_timestamp: datetime
+        claim_timestamp: datetime,
+        now: Optional[datetime] = None
     ) -> Dict:
         """Calculate work velocity (commits/PRs per day)"""
-        days_since_claim = (datetime.now(timezone.utc) - claim_timestamp).days
+        now = now or datetime.now(timezone.utc)
+        days_since_claim = (now - claim_timestamp).days
         if days_since_claim == 0:
             days_since_claim = 1
         
@@ -420,31 +738,40 @@ class ProgressAnalysisEngine:
     def _detect_stall_patterns(
         self, 
         commits: List[Dict], 
-        prs: List[Dict], 
-        review_activity: List[Dict]
+        pr_analysis: Dict, 
+        review_activity: List[Dict],
+        now: Optional[datetime] = None
     ) -> List[str]:
-        """Detect stall patterns indicating progress has stopped"""
+        """
+        Detect stall patterns indicating progress has stopped
+        Stalled PRs come from _analyze_pull_requests rather than a second scan
+        """
+        now = now or datetime.now(timezone.utc)
         signals = []
         
         if commits:
-            # Check last commit date
-            last_commit = max(
-                datetime.fromisoformat(c.get('created_at', c.get('date', '')).replace('Z', '+00:00'))
-                for c in commits
-                if c.get('created_at') or c.get('date')
+            # Check last commit date. Compare parsed timestamps, since
+            # sources may differ in offset or fractional-second format
+            latest = max(
+                (
+                    _parse_gh_ts(value)
+                    for value in (
+                        c.get('created_at') or c.get('date') or (c.get('author') or {}).get('date')
+                        for c in commits
+                    )
+                    if value
+                ),
+                default=None
             )
-            days_since_commit = (datetime.now(timezone.utc) - last_commit).days
             
-            if days_since_commit > self.STALL_INDICATORS['no_commits_days']:
-                signals.append(f'no_commits_{days_since_commit}_days')
-        
-        for pr in prs:
-            if pr.get('state') == 'open':
-                updated_at = datetime.fromisoformat(pr['updated_at'].replace('Z', '+00:00'))
-                days_since_update = (datetime.now(timezone.utc) - updated_at).days
+            if latest:
+                days_since_commit = (now - latest).days
                 
-                if days_since_update > self.STALL_INDICATORS['no_pr_updates_days']:
-                    signals.append(f'stalled_pr_{pr["number"]}')
+                if days_since_commit > self.STALL_INDICATORS['no_commits_days']:
+                    signals.append(f'no_commits_{days_since_commit}_days')
+        
+        for pr_number in pr_analysis['stalled_pr_numbers']:
+            signals.append(f'stalled_pr_{pr_number}')
         
         return signals
     
@@ -471,14 +798,13 @@ class ProgressAnalysisEngine:
             review_score * 0.10
         )
         
-        return max(0.0, min(100.0, overall_score))
+        return _clamp_percent(overall_score)
     
     def _predict_completion_probability(
         self,
         progress_score: float,
         velocity_analysis: Dict,
-        stall_signals: List[str],
-        claim_timestamp: datetime
+        stall_signals: List[str]
     ) -> float:
         """Predict probability of completing the claim (0-100%)"""
         
@@ -495,11 +821,11 @@ class ProgressAnalysisEngine:
         base_prob -= len(stall_signals) * 10
         
         # Penalize for time without completion
-        days_since_claim = (datetime.now(timezone.utc) - claim_timestamp).days
+        days_since_claim = velocity_analysis['days_active']
         if days_since_claim > 14:
             base_prob -= (days_since_claim - 14) * 2
         
-        return max(0.0, min(100.0, base_prob))
+        return _clamp_percent(base_prob)
     
     def _estimate_completion_timeline(
         self,
@@ -520,21 +846,12 @@ class ProgressAnalysisEngine:
         # Based on velocity and complexity
         velocity = velocity_analysis['velocity']
         
-        complexity_days = {
-            'TRIVIAL': 2,
-            'EASY': 5,
-            'MEDIUM': 10,
-            'HARD': 20,
-            'VERY_HARD': 30
-        }
+        if velocity <= 0:
+            return self._IDLE_COMPLETION_DAYS.get(issue_complexity, 20)
         
-        base_days = complexity_days.get(issue_complexity, 10)
-        
-        if velocity > 0:
-            # Adjust based on velocity
-            estimated_days = int(base_days / (velocity + 0.1))
-        else:
-            estimated_days = base_days * 2
+        # Adjust based on velocity
+        base_days = self._COMPLEXITY_DAYS.get(issue_complexity, 10)
+        estimated_days = int(base_days / (velocity + 0.1))
         
         return max(1, min(60, estimated_days))
     
@@ -599,19 +916,25 @@ class ProgressAnalysisEngine:
         else:
             return 20.0
     
-    def _identify_risk_signals(
+    def _compute_signals(
         self,
         commit_analysis: Dict,
         pr_analysis: Dict,
-        velocity_analysis: Dict
+        velocity_analysis: Dict,
+        stall_signals: List[str]
     ) -> List[str]:
-        """Identify risk signals for non-completion"""
-        signals = []
+        """Stall signals followed by risk signals for non-completion, in one list"""
+        trivial_count = commit_analysis['trivial_count']
+        meaningful_count = commit_analysis['meaningful_count']
+        draft_prs = pr_analysis['draft_prs']
+        open_prs = pr_analysis['open_prs']
+        
+        signals = list(stall_signals)
         
-        if commit_analysis['trivial_count'] > commit_analysis['meaningful_count']:
+        if trivial_count > meaningful_count:
             signals.append('mostly_trivial_commits')
         
-        if pr_analysis['draft_prs'] > pr_analysis['open_prs']:
+        if draft_prs > open_prs:
             signals.append('only_draft_prs')
         
         if velocity_analysis['velocity'] < 0.1:
@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from fastapi import FastAPI, Request, Response, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,7 +21,10 @@ from app.core.monitoring import (
     CONTENT_TYPE_LATEST
 )
 from app.core.security import add_security_headers, get_current_user
-from app.db.database import get_async_session, create_tables, close_db
+from app.db.database import (
+    get_async_session, get_async_session_factory, get_engine, create_tables, close_db,
+    start_db_heartbeat, stop_db_heartbeat
+)
 from app.db.models.user import User
 
 # Import all route modules
@@ -31,7 +34,10 @@ from app.api.claim_routes import router as claim_router
 from app.api.dashboard_routes import router as dashboard_router
 from app.api.webhook_routes import router as webhook_router
 from app.api.user_routes import router as user_router
-from app.api.settings_routes import router as settings_router
+from app.api.settings_routes import (
+    router as settings_router, get_cached_settings,
+    start_settings_listener, stop_settings_listener
+)
 from app.websockets.routes import router as websocket_router
 # Initialize configuration and logging
 settings = get_settings()
@@ -43,6 +49,7 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
+    app.state.started_at = datetime.now(timezone.utc)
     logger.info("Starting Cookie Licking Detector API")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
@@ -56,10 +63,29 @@ async def lifespan(app: FastAPI):
             logger.warning(f"Could not create database tables: {e}")
             logger.info("App will continue without database - some features may be limited")
     
+    # Keep the in-process settings cache coherent across workers
+    try:
+        engine = get_engine()
+        if engine:
+            await start_settings_listener(engine)
+            # Warm the settings cache so the first webhook delivery is DB-free
+            async with get_async_session_factory()() as session:
+                await get_cached_settings(session)
+                await session.commit()
+    except Exception as e:
+        logger.warning(f"Could not load system settings: {e}")
+    
+    start_db_heartbeat()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Cookie Licking Detector API")
+    await stop_db_heartbeat()
+    try:
+        await stop_settings_listener()
+    except Exception as e:
+        logger.warning(f"Error closing settings listener during shutdown: {e}")
     await close_db()
 
 
@@ -131,6 +157,7 @@ app = FastAPI(
         }
     ],
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     swagger_ui_parameters={
         "deepLinking": True,
         "displayRequestDuration": True,
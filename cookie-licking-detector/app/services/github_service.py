@@ -380,33 +380,9 @@ Thank you to everyone interested in contributing! 🎉"""
         try:
             await self._check_rate_limit()
             
-            repo = self.github.get_repo(f"{owner}/{name}")
-            
-            # Search for PRs that reference this issue
-            query = f"repo:{owner}/{name} is:pr #{issue_number}"
-            search_result = self.github.search_issues(query)
-            
-            prs = []
-            for pr in search_result:
-                if pr.pull_request:
-                    pr_data = repo.get_pull(pr.number)
-                    prs.append({
-                        "id": pr_data.id,
-                        "number": pr_data.number,
-                        "title": pr_data.title,
-                        "state": pr_data.state,
-                        "user": {
-                            "login": pr_data.user.login,
-                            "id": pr_data.user.id
-                        },
-                        "created_at": pr_data.created_at.isoformat(),
-                        "updated_at": pr_data.updated_at.isoformat(),
-                        "merged_at": pr_data.merged_at.isoformat() if pr_data.merged_at else None,
-                        "html_url": pr_data.html_url,
-                        "commits": pr_data.commits
-                    })
-            
-            return prs
+            # PyGithub blocks on every request (search, pagination, each
+            # get_pull), so run it off the event loop
+            return await asyncio.to_thread(self._fetch_pull_requests_for_issue, owner, name, issue_number)
             
         except GithubException as e:
             logger.error(f"GitHub API error getting PRs for issue {owner}/{name}#{issue_number}: {e}")
@@ -415,34 +391,46 @@ Thank you to everyone interested in contributing! 🎉"""
             logger.error(f"Unexpected error getting PRs for issue {owner}/{name}#{issue_number}: {e}")
             return []
 
+    def _fetch_pull_requests_for_issue(self, owner: str, name: str, issue_number: int) -> List[Dict[str, Any]]:
+        """Blocking PyGithub part of get_pull_requests_for_issue"""
+        
+        repo = self.github.get_repo(f"{owner}/{name}")
+        
+        # Search for PRs that reference this issue
+        query = f"repo:{owner}/{name} is:pr #{issue_number}"
+        search_result = self.github.search_issues(query)
+        
+        prs = []
+        for pr in search_result:
+            if pr.pull_request:
+                pr_data = repo.get_pull(pr.number)
+                prs.append({
+                    "id": pr_data.id,
+                    "number": pr_data.number,
+                    "title": pr_data.title,
+                    "state": pr_data.state,
+                    "user": {
+                        "login": pr_data.user.login,
+                        "id": pr_data.user.id
+                    },
+                    "created_at": pr_data.created_at.isoformat(),
+                    "updated_at": pr_data.updated_at.isoformat(),
+                    "merged_at": pr_data.merged_at.isoformat() if pr_data.merged_at else None,
+                    "html_url": pr_data.html_url,
+                    "commits": pr_data.commits
+                })
+        
+        return prs
+
     async def get_user_commits(self, owner: str, name: str, username: str, since: datetime) -> List[Dict[str, Any]]:
         """Get commits by a user in a repository since a specific date"""
         
         try:
             await self._check_rate_limit()
             
-            repo = self.github.get_repo(f"{owner}/{name}")
-            commits = repo.get_commits(author=username, since=since)
-            
-            commit_list = []
-            for commit in commits:
-                commit_list.append({
-                    "sha": commit.sha,
-                    "message": commit.commit.message,
-                    "author": {
-                        "name": commit.commit.author.name,
-                        "email": commit.commit.author.email,
-                        "date": commit.commit.author.date.isoformat()
-                    },
-                    "html_url": commit.html_url,
-                    "stats": {
-                        "additions": commit.stats.additions if commit.stats else 0,
-                        "deletions": commit.stats.deletions if commit.stats else 0,
-                        "total": commit.stats.total if commit.stats else 0
-                    }
-                })
-            
-            return commit_list
+            # Pagination and the per-commit stats lookups block; keep them
+            # off the event loop
+            return await asyncio.to_thread(self._fetch_user_commits, owner, name, username, since)
             
         except GithubException as e:
             logger.error(f"GitHub API error getting commits for {username} in {owner}/{name}: {e}")
@@ -451,6 +439,32 @@ Thank you to everyone interested in contributing! 🎉"""
             logger.error(f"Unexpected error getting commits for {username} in {owner}/{name}: {e}")
             return []
 
+    def _fetch_user_commits(self, owner: str, name: str, username: str, since: datetime) -> List[Dict[str, Any]]:
+        """Blocking PyGithub part of get_user_commits"""
+        
+        repo = self.github.get_repo(f"{owner}/{name}")
+        commits = repo.get_commits(author=username, since=since)
+        
+        commit_list = []
+        for commit in commits:
+            commit_list.append({
+                "sha": commit.sha,
+                "message": commit.commit.message,
+                "author": {
+                    "name": commit.commit.author.name,
+                    "email": commit.commit.author.email,
+                    "date": commit.commit.author.date.isoformat()
+                },
+                "html_url": commit.html_url,
+                "stats": {
+                    "additions": commit.stats.additions if commit.stats else 0,
+                    "deletions": commit.stats.deletions if commit.stats else 0,
+                    "total": commit.stats.total if commit.stats else 0
+                }
+            })
+        
+        return commit_list
+
     async def create_webhook(self, owner: str, name: str, webhook_url: str, secret: str) -> Dict[str, Any]:
         """Create a webhook for repository events"""
         